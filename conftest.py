@@ -0,0 +1,10 @@
+"""
+Root pytest configuration for Info Agent.
+
+Makes the project root importable once for the whole test session.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
@@ -9,7 +9,10 @@ Improved version that addresses TODOs and FIXMEs:
 
 import json
 import logging
+import uuid
 from typing import Dict, List, Any, TypedDict, Annotated, Optional, Literal
+
+import orjson
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, ToolMessage
 from langchain_core.tools import BaseTool
 from langchain_openai import ChatOpenAI
@@ -81,6 +84,8 @@ class MemoryAgent:
         self.model = model
         self.tools = tools or get_all_memory_tools()
         self.max_iterations = max_iterations
+        # Groups the traces of all queries handled by this agent
+        self.session_id = uuid.uuid4().hex
         
         # Setup LangSmith tracing if configured
         self.langsmith_enabled = setup_langsmith_tracing("info-agent-memory")
@@ -246,7 +251,7 @@ class MemoryAgent:
                         content=result,
                         tool_call_id=tool_call["id"]
                     ))
-                    new_results[tool_name] = json.loads(result) if result.startswith('{') else result
+                    new_results[tool_name] = orjson.loads(result) if result.startswith('{') else result
                     logger.info(f"Tool {tool_name} executed successfully")
                     
                     # Log tool execution to LangSmith
@@ -375,7 +380,7 @@ class MemoryAgent:
         
         # Create LangSmith run context
         operation_type = self._detect_operation_type(query)
-        run_context = create_run_context(query, operation_type)
+        run_context = create_run_context(query, operation_type, session_id=self.session_id)
         
         # Initialize state with tracing context
         initial_state = {
@@ -4,18 +4,38 @@ This module provides high-level functions to process text into Memory objects
 using AI extraction and embeddings.
 """
 
+import copy
 import json
 import logging
-from typing import Optional, Dict, Any
+import re
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 
+import orjson
+
 from .client import OpenAIClient, OpenAIClientError
 from .prompts import extract_all_information_prompt, search_analysis_prompt
 from ..core.models import Memory
+from ..utils.semantic_cache import SemanticCache
 
 
 logger = logging.getLogger(__name__)
 
+# Minimum word overlap (Jaccard) for a semantic cache hit, so texts with
+# close embeddings but different key terms are not merged
+MIN_CACHE_TOKEN_OVERLAP = 0.5
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def _token_overlap(a: str, b: str) -> float:
+    """Jaccard similarity of the lowercase word sets of two texts."""
+    tokens_a = set(_WORD_PATTERN.findall(a.lower()))
+    tokens_b = set(_WORD_PATTERN.findall(b.lower()))
+    if not tokens_a and not tokens_b:
+        return 1.0
+    return len(tokens_a & tokens_b) / len(tokens_a | tokens_b)
+
 
 class ProcessingError(Exception):
     """Raised when text processing fails."""
@@ -25,13 +45,17 @@ class ProcessingError(Exception):
 class MemoryProcessor:
     """Processes text into Memory objects using AI extraction."""
     
-    def __init__(self, ai_client: Optional[OpenAIClient] = None):
+    def __init__(self, ai_client: Optional[OpenAIClient] = None,
+                 cache: Optional[SemanticCache] = None):
         """Initialize memory processor.
         
         Args:
             ai_client: Optional OpenAI client. If None, creates a new one.
+            cache: Optional semantic cache of extraction results. Near-duplicate
+                texts reuse a cached extraction instead of calling the AI.
         """
         self.ai_client = ai_client or OpenAIClient()
+        self.cache = cache
         
     def process_text_to_memory(
         self, 
@@ -57,28 +81,20 @@ class MemoryProcessor:
         logger.info(f"Processing {len(text)} characters of text into memory")
         
         try:
-            # Generate extraction prompt
-            prompt = extract_all_information_prompt(text)
-            
-            # Add context if provided
-            if additional_context:
-                context_str = json.dumps(additional_context, indent=2)
-                prompt += f"\n\nAdditional context to consider:\n{context_str}"
+            # Extraction depends on the extra context, so only plain texts are cached
+            use_cache = self.cache is not None and not additional_context
+            embedding = self.generate_embedding(text) if use_cache else None
             
-            # Call AI for extraction
-            logger.debug("Calling AI for information extraction")
-            response = self.ai_client.chat_completion([{"role": "user", "content": prompt}])
-            
-            if not response.success:
-                raise ProcessingError(f"AI extraction failed: {response.error}")
-            
-            # Parse JSON response
-            try:
-                extracted_data = json.loads(response.content)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse AI response as JSON: {e}")
-                logger.debug(f"Raw response: {response.content}")
-                raise ProcessingError(f"Invalid JSON response from AI: {e}")
+            cached = self._get_cached_extraction(text, embedding) if embedding else None
+            if cached is not None:
+                logger.info("Using cached extraction for near-duplicate text")
+                extracted_data, model = cached
+                tokens_used = 0
+            else:
+                extracted_data, model, tokens_used = self._extract(text, additional_context)
+                if embedding:
+                    # Cache a private copy; the memory below shares extracted_data's lists
+                    self.cache.put(text, embedding, (text, copy.deepcopy(extracted_data), model))
             
             # Create Memory object
             title = force_title or extracted_data.get('title', 'Untitled Memory')
@@ -128,8 +144,8 @@ class MemoryProcessor:
             
             # Add processing metadata
             memory.dynamic_fields['ai_processed'] = True
-            memory.dynamic_fields['ai_model'] = response.model
-            memory.dynamic_fields['ai_tokens_used'] = response.tokens_used
+            memory.dynamic_fields['ai_model'] = model
+            memory.dynamic_fields['ai_tokens_used'] = tokens_used
             memory.dynamic_fields['processing_timestamp'] = datetime.now().isoformat()
             memory.dynamic_fields['processor_version'] = '1.0'
             
@@ -145,6 +161,70 @@ class MemoryProcessor:
             logger.error(f"Unexpected error during processing: {e}")
             raise ProcessingError(f"Processing failed: {e}")
     
+    def _extract(
+        self,
+        text: str,
+        additional_context: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Dict[str, Any], str, int]:
+        """Extract structured information from text with the AI client.
+        
+        Args:
+            text: The text content to process
+            additional_context: Optional context to include in extraction
+            
+        Returns:
+            Tuple of (extracted data, model name, tokens used)
+            
+        Raises:
+            ProcessingError: If the AI call fails or returns invalid JSON
+        """
+        # Generate extraction prompt
+        prompt = extract_all_information_prompt(text)
+        
+        # Add context if provided
+        if additional_context:
+            context_str = json.dumps(additional_context, indent=2)
+            prompt += f"\n\nAdditional context to consider:\n{context_str}"
+        
+        # Call AI for extraction
+        logger.debug("Calling AI for information extraction")
+        response = self.ai_client.chat_completion([{"role": "user", "content": prompt}])
+        
+        if not response.success:
+            raise ProcessingError(f"AI extraction failed: {response.error}")
+        
+        # Parse JSON response
+        try:
+            extracted_data = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Failed to parse AI response as JSON: {e}")
+            logger.debug(f"Raw response: {response.content}")
+            raise ProcessingError(f"Invalid JSON response from AI: {e}")
+        
+        return extracted_data, response.model, response.tokens_used
+    
+    def _get_cached_extraction(self, text: str, embedding: list) -> Optional[Tuple[Dict[str, Any], str]]:
+        """Look up a cached extraction for a near-duplicate text.
+        
+        Args:
+            text: The text content to process
+            embedding: Embedding of the text
+            
+        Returns:
+            Tuple of (extracted data, model name), or None on a miss
+        """
+        cached = self.cache.get_similar(embedding)
+        if cached is None:
+            return None
+        
+        cached_text, extracted_data, model = cached
+        if _token_overlap(text, cached_text) < MIN_CACHE_TOKEN_OVERLAP:
+            logger.debug("Semantic cache match rejected: low word overlap")
+            return None
+        
+        # Each memory gets its own lists, so editing one leaves the cache intact
+        return copy.deepcopy(extracted_data), model
+    
     def generate_embedding(self, text: str, model: Optional[str] = None) -> Optional[list]:
         """Generate embedding for text.
         
@@ -197,12 +277,12 @@ class MemoryProcessor:
             
             # Parse JSON response (required)
             try:
-                analysis = json.loads(response.content)
+                analysis = orjson.loads(response.content)
                 logger.info(f"Search query analysis successful: {analysis.get('search_intent', 'Unknown intent')}")
                 logger.debug(f"Full search analysis: {json.dumps(analysis, indent=2)}")
                 return analysis
                 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error(f"Failed to parse search analysis as JSON: {e}")
                 logger.debug(f"Raw response: {response.content}")
                 raise ProcessingError(f"Invalid JSON response from AI during search analysis: {e}")
@@ -7,6 +7,8 @@ This module contains structured prompt templates for various AI operations inclu
 - Content categorization
 """
 
+import string
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from enum import Enum
 
@@ -29,6 +31,13 @@ class PromptTemplate:
         """
         self.template = template
         self.required_vars = required_vars or []
+        
+        # Parse the template once instead of on every format() call
+        parsed = list(string.Formatter().parse(template))
+        self._field_names = tuple(fname for _, fname, _, _ in parsed if fname is not None)
+        self._required_set = frozenset(self.required_vars)
+        # Templates without fields still need {{ }} unescaped
+        self._static_text = None if self._field_names else ''.join(literal for literal, _, _, _ in parsed)
     
     def format(self, **kwargs) -> str:
         """Format template with provided variables.
@@ -43,11 +52,14 @@ class PromptTemplate:
             ValueError: If required variables are missing
         """
         # Check required variables
-        missing_vars = [var for var in self.required_vars if var not in kwargs]
-        if missing_vars:
+        if self._required_set and not self._required_set.issubset(kwargs):
+            missing_vars = [var for var in self.required_vars if var not in kwargs]
             raise ValueError(f"Missing required variables: {missing_vars}")
         
-        return self.template.format(**kwargs)
+        if self._static_text is not None:
+            return self._static_text
+        
+        return self.template.format_map(kwargs)
 
 
 # Unified information extraction prompt template
@@ -172,11 +184,13 @@ class PromptManager:
 
 
 # Convenience function
+@lru_cache(maxsize=256)
 def extract_all_information_prompt(text: str) -> str:
     """Generate unified prompt for complete information extraction.
     
     Extracts title, description, summary, categories, entities, facts, 
     and dynamic fields in a single AI call for maximum efficiency.
+    Prompts are cached per text, since the template is fixed.
     
     Args:
         text: Text to analyze
@@ -31,6 +31,7 @@ class InfoAgentContext:
     
     def __init__(self):
         self.verbose = False
+        self.db_path = None
         self.logger = None
         self.memory_service = None
     
@@ -43,7 +44,7 @@ class InfoAgentContext:
         
         # Initialize memory service
         try:
-            self.memory_service = get_memory_service()
+            self.memory_service = get_memory_service(self.db_path)
             if verbose:
                 self.logger.debug("Memory service initialized")
         except Exception as e:
@@ -54,8 +55,10 @@ class InfoAgentContext:
 # Main CLI group
 @click.group()
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
+@click.option('--db-path', envvar='INFO_AGENT_DB', type=click.Path(dir_okay=False),
+              help='Database file to use instead of the default location')
 @click.pass_context
-def cli(ctx, verbose: bool):
+def cli(ctx, verbose: bool, db_path: Optional[str]):
     """
     Info Agent - AI-powered personal memory and information management system.
     
@@ -65,6 +68,7 @@ def cli(ctx, verbose: bool):
     # Create context object
     ctx.ensure_object(InfoAgentContext)
     ctx.obj.verbose = verbose
+    ctx.obj.db_path = db_path
     # Setup logging
     ctx.obj.setup_logging(verbose)
     
@@ -501,9 +505,9 @@ def add(ctx, text: str, title: Optional[str], memory_id: Optional[int]):
             title=title or f"Vector Test Memory {memory_id or 1}"
         )
         
-        # Add to vector store
+        # Add to vector store (written immediately; only queue_memory defers writes)
         click.echo("💾 Adding to vector store...")
-        success = vector_store.add_memory(memory)
+        success = vector_store.add_memories([memory])
         
         if success:
             click.echo("✅ Content added to vector store successfully!")
@@ -5,14 +5,15 @@ This module provides SQLite database connectivity and basic CRUD operations
 for Memory objects, with connection pooling and error handling.
 """
 
+import os
 import sqlite3
 import threading
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Tuple, Union
 from contextlib import contextmanager
 from datetime import datetime
 
-from info_agent.core.models import Memory, MemorySearchResult
+from info_agent.core.models import Memory, MemoryPreview, MemorySearchResult
 from info_agent.core.schema import DatabaseSchema, SchemaConstants
 from info_agent.utils.logging_config import get_logger
 
@@ -40,14 +41,17 @@ class DatabaseConnection:
     CRUD operations for Memory objects.
     """
     
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, bulk_mode: bool = False):
         """
         Initialize database connection.
         
         Args:
             db_path: Path to SQLite database file. If None, uses default.
+            bulk_mode: Skip fsync during bulk inserts. Faster, but a crash
+                mid-insert can lose the batch; meant for tests and imports.
         """
         self.logger = get_logger(__name__)
+        self.bulk_mode = bulk_mode
         self._lock = threading.Lock()
         self._connection: Optional[sqlite3.Connection] = None
         
@@ -85,6 +89,12 @@ class DatabaseConnection:
                     self._connection.execute("PRAGMA foreign_keys = ON")
                     self._connection.execute("PRAGMA journal_mode = WAL")
                     
+                    # Test databases don't need crash durability
+                    if os.environ.get("INFO_AGENT_TEST") == "1":
+                        self._connection.execute("PRAGMA synchronous = NORMAL")
+                        self._connection.execute("PRAGMA temp_store = MEMORY")
+                        self._connection.execute("PRAGMA mmap_size = 268435456")
+                    
                     self.logger.info("Database connection established")
                     
                 except sqlite3.Error as e:
@@ -125,6 +135,29 @@ class DatabaseConnection:
             self.logger.error(f"Transaction rolled back: {e}")
             raise
     
+    @contextmanager
+    def _bulk_pragmas(self):
+        """
+        Relax durability PRAGMAs for one bulk insert when bulk_mode is set.
+        
+        The previous settings are restored afterwards. journal_mode stays
+        WAL since changing it needs exclusive access to the database.
+        """
+        if not self.bulk_mode:
+            yield
+            return
+        
+        conn = self.connect()
+        synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+        temp_store = conn.execute("PRAGMA temp_store").fetchone()[0]
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        try:
+            yield
+        finally:
+            conn.execute(f"PRAGMA synchronous = {synchronous}")
+            conn.execute(f"PRAGMA temp_store = {temp_store}")
+    
     def execute_query(self, query: str, params: tuple = ()) -> sqlite3.Cursor:
         """
         Execute a SQL query with parameters.
@@ -159,19 +192,16 @@ class DatabaseConnection:
     
     # CRUD Operations for Memory
     
-    def create_memory(self, memory: Memory) -> Memory:
+    def _insert_memory(self, memory: Memory, on_conflict: str = "") -> sqlite3.Cursor:
         """
-        Create a new memory in the database.
+        Validate, timestamp and insert a memory in its own transaction.
         
         Args:
-            memory: Memory object to create
+            memory: Memory object to insert
+            on_conflict: Optional upsert clause, e.g. "ON CONFLICT(content_hash) DO NOTHING"
             
         Returns:
-            Memory object with assigned ID and timestamps
-            
-        Raises:
-            ValidationError: If memory data is invalid
-            DatabaseError: If creation fails
+            Cursor of the executed insert
         """
         # Validate memory
         errors = memory.validate()
@@ -192,21 +222,122 @@ class DatabaseConnection:
         query = f"""
             INSERT INTO memories ({', '.join(columns)})
             VALUES ({placeholders})
+            {on_conflict}
+        """
+        
+        with self.transaction():
+            return self.execute_query(query, tuple(values))
+    
+    def create_memory(self, memory: Memory) -> Memory:
         """
+        Create a new memory in the database.
         
+        Args:
+            memory: Memory object to create
+            
+        Returns:
+            Memory object with assigned ID and timestamps
+            
+        Raises:
+            ValidationError: If memory data is invalid
+            DatabaseError: If creation fails
+        """
         try:
-            with self.transaction():
-                cursor = self.execute_query(query, tuple(values))
-                memory.id = cursor.lastrowid
-                
-                self.logger.info(f"Created memory with ID: {memory.id}")
-                return memory
+            cursor = self._insert_memory(memory)
+            memory.id = cursor.lastrowid
+            
+            self.logger.info(f"Created memory with ID: {memory.id}")
+            return memory
                 
         except sqlite3.IntegrityError as e:
             if "content_hash" in str(e):
                 raise ValidationError("Memory with this content already exists")
             raise DatabaseError(f"Memory creation failed: {e}")
     
+    def try_create_memory(self, memory: Memory) -> Optional[Memory]:
+        """
+        Create a new memory unless one with the same content already exists.
+        
+        Only a conflict on the content hash is skipped (ON CONFLICT ... DO
+        NOTHING), so a duplicate costs a single statement and no exception.
+        Any other constraint violation still fails the insert.
+        
+        Args:
+            memory: Memory object to create
+            
+        Returns:
+            Memory object with assigned ID, or None if it was a duplicate
+            
+        Raises:
+            ValidationError: If memory data is invalid
+            DatabaseError: If the insert fails, including on constraint
+                violations other than a duplicate content hash
+        """
+        cursor = self._insert_memory(memory, "ON CONFLICT(content_hash) DO NOTHING")
+        if cursor.rowcount == 0:
+            self.logger.info(f"Duplicate memory ignored: {memory.content_hash}")
+            return None
+        
+        memory.id = cursor.lastrowid
+        self.logger.info(f"Created memory with ID: {memory.id}")
+        return memory
+    
+    def create_memories(self, memories: List[Memory]) -> List[Memory]:
+        """
+        Create multiple memories in a single transaction.
+        
+        Args:
+            memories: Memory objects to create
+            
+        Returns:
+            The same Memory objects with assigned IDs and timestamps
+            
+        Raises:
+            ValidationError: If any memory is invalid or already exists
+            DatabaseError: If creation fails
+        """
+        if not memories:
+            return []
+        
+        for memory in memories:
+            errors = memory.validate()
+            if errors:
+                raise ValidationError(f"Memory validation failed: {', '.join(errors)}")
+        
+        now = datetime.now()
+        for memory in memories:
+            memory.created_at = now
+            memory.updated_at = now
+        
+        columns = [k for k in memories[0].to_dict().keys() if k != 'id']
+        rows = [tuple(data[k] for k in columns) for data in (m.to_dict() for m in memories)]
+        placeholders = ', '.join(['?' for _ in columns])
+        
+        query = f"""
+            INSERT INTO memories ({', '.join(columns)})
+            VALUES ({placeholders})
+        """
+        
+        try:
+            with self._bulk_pragmas(), self.transaction() as conn:
+                conn.executemany(query, rows)
+                last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        except sqlite3.IntegrityError as e:
+            if "content_hash" in str(e):
+                raise ValidationError("Memory with this content already exists")
+            raise DatabaseError(f"Memory creation failed: {e}")
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to create memories: {e}")
+            raise DatabaseError(f"Memory creation failed: {e}")
+        
+        # The transaction holds the write lock, so AUTOINCREMENT IDs are contiguous
+        first_id = last_id - len(memories) + 1
+        for offset, memory in enumerate(memories):
+            memory.id = first_id + offset
+        
+        self.logger.info(f"Created {len(memories)} memories (IDs {first_id}-{last_id})")
+        return memories
+    
     def get_memory_by_id(self, memory_id: int) -> Optional[Memory]:
         """
         Retrieve a memory by ID.
@@ -338,25 +469,39 @@ class DatabaseConnection:
             self.logger.error(f"Failed to delete memory {memory_id}: {e}")
             raise DatabaseError(f"Memory deletion failed: {e}")
     
-    def get_recent_memories(self, limit: int = 20, offset: int = 0) -> List[Memory]:
+    def get_recent_memories(self, limit: int = 20, offset: int = 0,
+                            before: Optional[Tuple[str, int]] = None) -> List[Memory]:
         """
         Get recent memories in chronological order.
         
         Args:
             limit: Maximum number of memories to return
-            offset: Number of memories to skip
+            offset: Number of memories to skip (ignored if before is given)
+            before: (created_at ISO string, id) of the last memory of the
+                previous page. Seeks there through the index instead of
+                skipping offset rows.
             
         Returns:
             List of Memory objects
         """
-        query = """
-            SELECT * FROM memories 
-            ORDER BY created_at DESC 
-            LIMIT ? OFFSET ?
-        """
+        if before is not None:
+            query = """
+                SELECT * FROM memories 
+                WHERE (created_at, id) < (?, ?)
+                ORDER BY created_at DESC, id DESC 
+                LIMIT ?
+            """
+            params = (before[0], before[1], limit)
+        else:
+            query = """
+                SELECT * FROM memories 
+                ORDER BY created_at DESC, id DESC 
+                LIMIT ? OFFSET ?
+            """
+            params = (limit, offset)
         
         try:
-            cursor = self.execute_query(query, (limit, offset))
+            cursor = self.execute_query(query, params)
             memories = []
             
             for row in cursor.fetchall():
@@ -369,6 +514,79 @@ class DatabaseConnection:
             self.logger.error(f"Failed to get recent memories: {e}")
             raise DatabaseError(f"Failed to retrieve recent memories: {e}")
     
+    def get_recent_memory_previews(self, limit: int = 20, offset: int = 0,
+                                   before: Optional[Tuple[str, int]] = None,
+                                   preview_length: int = 200) -> List[MemoryPreview]:
+        """
+        Get recent memories with content truncated in SQL.
+        
+        Only the first preview_length characters of each memory's content
+        are read from the database.
+        
+        Args:
+            limit: Maximum number of memories to return
+            offset: Number of memories to skip (ignored if before is given)
+            before: (created_at ISO string, id) of the last memory of the
+                previous page
+            preview_length: Maximum number of content characters returned
+            
+        Returns:
+            List of MemoryPreview objects
+        """
+        columns = """
+            id, title, substr(content, 1, ?) AS content_preview,
+            length(content) AS content_length, word_count, dynamic_fields, created_at
+        """
+        if before is not None:
+            query = f"""
+                SELECT {columns} FROM memories 
+                WHERE (created_at, id) < (?, ?)
+                ORDER BY created_at DESC, id DESC 
+                LIMIT ?
+            """
+            params = (preview_length, before[0], before[1], limit)
+        else:
+            query = f"""
+                SELECT {columns} FROM memories 
+                ORDER BY created_at DESC, id DESC 
+                LIMIT ? OFFSET ?
+            """
+            params = (preview_length, limit, offset)
+        
+        try:
+            cursor = self.execute_query(query, params)
+            previews = [MemoryPreview.from_dict(dict(row), preview_length) for row in cursor.fetchall()]
+            
+            self.logger.debug(f"Retrieved {len(previews)} recent memory previews")
+            return previews
+            
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to get recent memory previews: {e}")
+            raise DatabaseError(f"Failed to retrieve recent memories: {e}")
+    
+    _FTS_SEARCH_QUERY = """
+        SELECT m.*, 
+               rank as relevance_score
+        FROM memories m
+        JOIN search_index s ON m.id = s.rowid
+        WHERE search_index MATCH ?
+        ORDER BY rank
+        LIMIT ?
+    """
+    
+    @staticmethod
+    def _row_to_search_result(row: sqlite3.Row) -> MemorySearchResult:
+        """Convert an FTS result row to a MemorySearchResult."""
+        row_dict = dict(row)
+        relevance_score = row_dict.pop('relevance_score', 0.0)
+        
+        return MemorySearchResult(
+            memory=Memory.from_dict(row_dict),
+            relevance_score=float(relevance_score),
+            match_type="fts",
+            matched_fields=["content", "title", "summary"]
+        )
+    
     def search_memories_fts(self, query: str, limit: int = 20) -> List[MemorySearchResult]:
         """
         Search memories using full-text search.
@@ -380,32 +598,9 @@ class DatabaseConnection:
         Returns:
             List of MemorySearchResult objects
         """
-        sql_query = """
-            SELECT m.*, 
-                   rank as relevance_score
-            FROM memories m
-            JOIN search_index s ON m.id = s.rowid
-            WHERE search_index MATCH ?
-            ORDER BY rank
-            LIMIT ?
-        """
-        
         try:
-            cursor = self.execute_query(sql_query, (query, limit))
-            results = []
-            
-            for row in cursor.fetchall():
-                row_dict = dict(row)
-                relevance_score = row_dict.pop('relevance_score', 0.0)
-                
-                memory = Memory.from_dict(row_dict)
-                result = MemorySearchResult(
-                    memory=memory,
-                    relevance_score=float(relevance_score),
-                    match_type="fts",
-                    matched_fields=["content", "title", "summary"]
-                )
-                results.append(result)
+            cursor = self.execute_query(self._FTS_SEARCH_QUERY, (query, limit))
+            results = [self._row_to_search_result(row) for row in cursor.fetchall()]
             
             self.logger.debug(f"FTS search returned {len(results)} results")
             return results
@@ -414,6 +609,32 @@ class DatabaseConnection:
             self.logger.error(f"FTS search failed: {e}")
             raise DatabaseError(f"Full-text search failed: {e}")
     
+    def search_memories_fts_many(self, queries: List[str], limit: int = 20) -> Dict[str, List[MemorySearchResult]]:
+        """
+        Run several full-text searches with one cursor and prepared statement.
+        
+        Args:
+            queries: Search query strings
+            limit: Maximum number of results per query
+            
+        Returns:
+            Dict mapping each query to its list of MemorySearchResult objects
+        """
+        conn = self.connect()
+        try:
+            cursor = conn.cursor()
+            results = {}
+            for query in queries:
+                cursor.execute(self._FTS_SEARCH_QUERY, (query, limit))
+                results[query] = [self._row_to_search_result(row) for row in cursor.fetchall()]
+            
+            self.logger.debug(f"FTS batch search ran {len(queries)} queries")
+            return results
+            
+        except sqlite3.Error as e:
+            self.logger.error(f"FTS batch search failed: {e}")
+            raise DatabaseError(f"Full-text search failed: {e}")
+    
     def count_memories(self) -> int:
         """Get total count of memories."""
         query = "SELECT COUNT(*) FROM memories"
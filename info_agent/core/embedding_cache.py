@@ -0,0 +1,93 @@
+"""
+Persistent embedding cache for the Info Agent vector store.
+
+Embeddings depend only on the model and the text, so they are stored in a
+small SQLite database keyed by a hash of both and reused across processes.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """SQLite-backed cache of float32 embeddings keyed by model and text."""
+
+    def __init__(self, path: Path):
+        """Initialize the cache; the database is opened on first use.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model: str, text: str) -> str:
+        """Build the cache key of a text embedded with the given model."""
+        return hashlib.sha256(f"{model}|{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """Look up cached embeddings.
+
+        Args:
+            keys: Cache keys from key()
+
+        Returns:
+            Embeddings found in the cache, by key
+        """
+        if not keys:
+            return {}
+
+        found = {}
+        with self._lock:
+            connection = self._connect()
+            # Stay below SQLite's bound parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = connection.execute(
+                    f"SELECT key, embedding FROM embeddings WHERE key IN ({', '.join('?' * len(chunk))})",
+                    chunk
+                )
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def put_many(self, embeddings: Dict[str, np.ndarray]) -> None:
+        """Store embeddings in one transaction.
+
+        Args:
+            embeddings: Embeddings by cache key
+        """
+        if not embeddings:
+            return
+
+        rows = [
+            (key, np.asarray(embedding, dtype=np.float32).tobytes())
+            for key, embedding in embeddings.items()
+        ]
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "INSERT OR IGNORE INTO embeddings (key, embedding) VALUES (?, ?)", rows
+                )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get or create the database connection (caller holds the lock)."""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, embedding BLOB NOT NULL)"
+            )
+        return self._connection
+
+
+# Export main classes
+__all__ = ['EmbeddingCache']
@@ -0,0 +1,46 @@
+"""
+Embedding functions for the Info Agent vector store.
+
+This module provides ChromaDB-compatible embedding functions used to
+embed memories and search queries.
+"""
+
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+
+
+class OnnxSentenceTransformerEmbeddingFunction(EmbeddingFunction[Documents]):
+    """Sentence Transformers embedding function running on ONNX Runtime.
+    
+    Uses a quantized ONNX export of the model instead of FP32 PyTorch
+    inference, which is significantly faster on CPU.
+    """
+    
+    def __init__(self, model_name: str, file_name: str, batch_size: int = 64):
+        """Load the ONNX model.
+        
+        Args:
+            model_name: Sentence Transformers model name
+            file_name: ONNX file inside the model repository
+            batch_size: Number of documents per inference batch
+        """
+        from sentence_transformers import SentenceTransformer
+        
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self._model = SentenceTransformer(
+            model_name,
+            backend="onnx",
+            model_kwargs={"file_name": file_name}
+        )
+    
+    def __call__(self, input: Documents) -> Embeddings:
+        """Embed documents as normalized vectors."""
+        return self._model.encode(
+            list(input),
+            batch_size=self.batch_size,
+            normalize_embeddings=True
+        ).tolist()
+
+
+# Export main classes
+__all__ = ['OnnxSentenceTransformerEmbeddingFunction']
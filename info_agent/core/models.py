@@ -6,12 +6,30 @@ for representing memory records in the application.
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 import json
 import hashlib
 
 
+@lru_cache(maxsize=4096)
+def compute_content_hash(content: str) -> str:
+    """
+    Compute the SHA256 hash of content for deduplication.
+    
+    Results are cached, so repeated content (re-saved memories, test
+    fixtures) is only hashed once.
+    
+    Args:
+        content: Memory content text
+        
+    Returns:
+        Hex digest of the UTF-8 encoded content
+    """
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
 @dataclass
 class Memory:
     """
@@ -63,8 +81,7 @@ class Memory:
     
     def _generate_content_hash(self) -> str:
         """Generate SHA256 hash of content for deduplication."""
-        content_bytes = self.content.encode('utf-8')
-        return hashlib.sha256(content_bytes).hexdigest()
+        return compute_content_hash(self.content)
     
     def _generate_search_text(self) -> str:
         """Generate processed text for full-text search indexing."""
@@ -272,5 +289,51 @@ class MemorySearchResult:
         return f"SearchResult(score={self.relevance_score:.3f}, {self.memory})"
 
 
+@dataclass
+class MemoryPreview:
+    """
+    Lightweight view of a memory for listings, with content truncated by the database.
+    """
+    id: int
+    title: str
+    content_preview: str  # Truncated content, with "..." if it was cut
+    content_length: int
+    word_count: int = 0
+    dynamic_fields: Dict[str, Any] = field(default_factory=dict)
+    created_at: Optional[datetime] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], preview_length: int) -> 'MemoryPreview':
+        """Create MemoryPreview from a preview query row."""
+        dynamic_fields = {}
+        if data.get('dynamic_fields'):
+            try:
+                dynamic_fields = json.loads(data['dynamic_fields'])
+            except json.JSONDecodeError:
+                dynamic_fields = {}
+        
+        created_at = None
+        if data.get('created_at'):
+            try:
+                created_at = datetime.fromisoformat(data['created_at'])
+            except (ValueError, TypeError):
+                created_at = None
+        
+        content_length = data.get('content_length') or 0
+        content_preview = data.get('content_preview') or ''
+        if content_length > preview_length:
+            content_preview += "..."
+        
+        return cls(
+            id=data.get('id'),
+            title=data.get('title', ''),
+            content_preview=content_preview,
+            content_length=content_length,
+            word_count=data.get('word_count') or 0,
+            dynamic_fields=dynamic_fields,
+            created_at=created_at
+        )
+
+
 # Export main classes
-__all__ = ['Memory', 'MemorySearchResult']
+__all__ = ['Memory', 'MemoryPreview', 'MemorySearchResult', 'compute_content_hash']
@@ -7,13 +7,15 @@ interface, abstracting database details from business logic.
 
 import json
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any, Union
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple, Union
 from datetime import datetime, timedelta
+from pathlib import Path
 
-from info_agent.core.models import Memory, MemorySearchResult
+from info_agent.core.models import Memory, MemoryPreview, MemorySearchResult
 from info_agent.core.database import DatabaseConnection, get_database
 from info_agent.core.migrations import DatabaseInitializer
-from info_agent.core.vector_store import VectorStore, get_vector_store
+from info_agent.core.vector_store import VectorStore, VectorStoreConfig, get_vector_store
 from info_agent.core.ranking import get_enhanced_ranker
 from info_agent.ai.processor import MemoryProcessor, ProcessingError
 from info_agent.utils.logging_config import get_logger
@@ -53,17 +55,26 @@ class MemoryRepositoryInterface(ABC):
         pass
     
     @abstractmethod
-    def get_recent(self, limit: int = 20, offset: int = 0) -> List[Memory]:
+    def get_recent(self, limit: int = 20, offset: int = 0,
+                   before: Optional[Tuple[str, int]] = None) -> List[Memory]:
         """Get recent memories."""
         pass
     
+    @abstractmethod
+    def get_recent_previews(self, limit: int = 20, offset: int = 0,
+                            before: Optional[Tuple[str, int]] = None,
+                            preview_length: int = 200) -> List[MemoryPreview]:
+        """Get previews of recent memories."""
+        pass
+    
     @abstractmethod
     def search(self, query: str, limit: int = 20) -> List[MemorySearchResult]:
         """Search memories using text search."""
         pass
     
     @abstractmethod
-    def semantic_search(self, query: str, limit: int = 20) -> List[MemorySearchResult]:
+    def semantic_search(self, query: str, limit: int = 20,
+                        min_score: Optional[float] = None) -> List[MemorySearchResult]:
         """Search memories using semantic/vector similarity."""
         pass
     
@@ -136,17 +147,7 @@ class SQLiteMemoryRepository(MemoryRepositoryInterface):
                     return existing
             
             created_memory = self.db.create_memory(memory)
-            
-            # Add to vector store
-            try:
-                success = self.vector_store.add_memory(created_memory)
-                if success:
-                    self.logger.debug(f"Added memory {created_memory.id} to vector store")
-                else:
-                    self.logger.warning(f"Failed to add memory {created_memory.id} to vector store")
-            except Exception as e:
-                self.logger.error(f"Vector store add failed for memory {created_memory.id}: {e}")
-                # Don't fail the entire operation if vector store fails
+            self._add_to_vector_store(created_memory)
             
             self.logger.info(f"Created memory: {created_memory.id}")
             return created_memory
@@ -157,6 +158,77 @@ class SQLiteMemoryRepository(MemoryRepositoryInterface):
                 raise
             raise RepositoryError(f"Memory creation failed: {e}")
     
+    def try_create(self, memory: Memory) -> Optional[Memory]:
+        """
+        Create a new memory unless its content already exists.
+        
+        Duplicate detection is left to the database's unique content hash,
+        so no lookup query is needed first.
+        
+        Args:
+            memory: Memory object to create
+            
+        Returns:
+            Created memory with assigned ID, or None if it was a duplicate
+            
+        Raises:
+            RepositoryError: If creation fails
+        """
+        try:
+            created_memory = self.db.try_create_memory(memory)
+        except Exception as e:
+            self.logger.error(f"Failed to create memory: {e}")
+            raise RepositoryError(f"Memory creation failed: {e}")
+        
+        if created_memory is not None:
+            self._add_to_vector_store(created_memory)
+        return created_memory
+    
+    def _add_to_vector_store(self, memory: Memory):
+        """Add a created memory to the vector store without failing the caller."""
+        try:
+            success = self.vector_store.add_memory(memory)
+            if success:
+                self.logger.debug(f"Added memory {memory.id} to vector store")
+            else:
+                self.logger.warning(f"Failed to add memory {memory.id} to vector store")
+        except Exception as e:
+            self.logger.error(f"Vector store add failed for memory {memory.id}: {e}")
+            # Don't fail the entire operation if vector store fails
+    
+    def bulk_create(self, memories: List[Memory]) -> List[Memory]:
+        """
+        Create multiple memories in a single database transaction.
+        
+        Unlike create(), duplicates are not resolved to the existing memory;
+        a duplicate anywhere in the batch fails the whole batch.
+        
+        Args:
+            memories: Memory objects to create
+            
+        Returns:
+            Created memories with assigned IDs
+            
+        Raises:
+            RepositoryError: If creation fails
+        """
+        try:
+            created_memories = self.db.create_memories(memories)
+        except Exception as e:
+            self.logger.error(f"Failed to create memories: {e}")
+            raise RepositoryError(f"Bulk memory creation failed: {e}")
+        
+        # Add to vector store in one batch
+        try:
+            if not self.vector_store.add_memories(created_memories):
+                self.logger.warning(f"Failed to add {len(created_memories)} memories to vector store")
+        except Exception as e:
+            self.logger.error(f"Vector store bulk add failed: {e}")
+            # Don't fail the entire operation if vector store fails
+        
+        self.logger.info(f"Created {len(created_memories)} memories")
+        return created_memories
+    
     def get_by_id(self, memory_id: int) -> Optional[Memory]:
         """
         Get memory by ID.
@@ -245,19 +317,22 @@ class SQLiteMemoryRepository(MemoryRepositoryInterface):
             self.logger.error(f"Failed to delete memory {memory_id}: {e}")
             raise RepositoryError(f"Memory deletion failed: {e}")
     
-    def get_recent(self, limit: int = 20, offset: int = 0) -> List[Memory]:
+    def get_recent(self, limit: int = 20, offset: int = 0,
+                   before: Optional[Tuple[str, int]] = None) -> List[Memory]:
         """
         Get recent memories in chronological order.
         
         Args:
             limit: Maximum number of memories to return
-            offset: Number of memories to skip
+            offset: Number of memories to skip (ignored if before is given)
+            before: (created_at ISO string, id) of the last memory of the
+                previous page, for keyset pagination
             
         Returns:
             List of recent Memory objects
         """
         try:
-            memories = self.db.get_recent_memories(limit=limit, offset=offset)
+            memories = self.db.get_recent_memories(limit=limit, offset=offset, before=before)
             self.logger.debug(f"Retrieved {len(memories)} recent memories")
             return memories
             
@@ -265,6 +340,31 @@ class SQLiteMemoryRepository(MemoryRepositoryInterface):
             self.logger.error(f"Failed to get recent memories: {e}")
             raise RepositoryError(f"Failed to retrieve recent memories: {e}")
     
+    def get_recent_previews(self, limit: int = 20, offset: int = 0,
+                            before: Optional[Tuple[str, int]] = None,
+                            preview_length: int = 200) -> List[MemoryPreview]:
+        """
+        Get previews of recent memories, truncated by the database.
+        
+        Args:
+            limit: Maximum number of memories to return
+            offset: Number of memories to skip (ignored if before is given)
+            before: (created_at ISO string, id) of the last memory of the
+                previous page, for keyset pagination
+            preview_length: Maximum number of content characters returned
+            
+        Returns:
+            List of recent MemoryPreview objects
+        """
+        try:
+            return self.db.get_recent_memory_previews(
+                limit=limit, offset=offset, before=before, preview_length=preview_length
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Failed to get recent memory previews: {e}")
+            raise RepositoryError(f"Failed to retrieve recent memories: {e}")
+    
     def search(self, query: str, limit: int = 20) -> List[MemorySearchResult]:
         """
         Search memories using full-text search.
@@ -285,6 +385,24 @@ class SQLiteMemoryRepository(MemoryRepositoryInterface):
             self.logger.error(f"Search failed for query '{query}': {e}")
             raise RepositoryError(f"Search operation failed: {e}")
     
+    def search_many(self, queries: List[str], limit: int = 20) -> Dict[str, List[MemorySearchResult]]:
+        """
+        Run several full-text searches in one batch.
+        
+        Args:
+            queries: Search query strings
+            limit: Maximum number of results per query
+            
+        Returns:
+            Dict mapping each query to its results
+        """
+        try:
+            return self.db.search_memories_fts_many(queries, limit=limit)
+            
+        except Exception as e:
+            self.logger.error(f"Batch search failed for {len(queries)} queries: {e}")
+            raise RepositoryError(f"Search operation failed: {e}")
+    
     def count(self) -> int:
         """
         Get total count of memories.
@@ -416,19 +534,21 @@ class SQLiteMemoryRepository(MemoryRepositoryInterface):
             self.logger.error(f"Failed to get statistics: {e}")
             return {'error': str(e)}
     
-    def semantic_search(self, query: str, limit: int = 20) -> List[MemorySearchResult]:
+    def semantic_search(self, query: str, limit: int = 20,
+                        min_score: Optional[float] = None) -> List[MemorySearchResult]:
         """
         Search memories using semantic/vector similarity.
         
         Args:
             query: Search query string
             limit: Maximum number of results
+            min_score: Minimum similarity score of returned results
             
         Returns:
             List of MemorySearchResult objects with similarity scores
         """
         try:
-            vector_results = self.vector_store.search_memories(query, limit=limit)
+            vector_results = self.vector_store.search_memories(query, limit=limit, min_score=min_score)
             search_results = []
             
             # vector_results are already MemorySearchResult objects from the vector store
@@ -561,6 +681,36 @@ class SQLiteMemoryRepository(MemoryRepositoryInterface):
             return {'error': str(e)}
 
 
+def _lower_terms(terms: List[Any]) -> List[str]:
+    """Lower-case filter terms once, skipping non-string entries."""
+    return [term.lower() for term in terms if isinstance(term, str)]
+
+
+def _terms_overlap(search_terms: List[str], memory_terms: List[Any]) -> bool:
+    """
+    Check whether any search term and memory term contain one another.
+    
+    Args:
+        search_terms: Pre-lowered search terms
+        memory_terms: Raw terms from a memory's dynamic fields
+        
+    Returns:
+        True if any pair matches as a substring in either direction
+    """
+    search_set = set(search_terms)
+    for memory_term in memory_terms:
+        if not isinstance(memory_term, str):
+            continue
+        memory_term = memory_term.lower()
+        # Exact matches are the common case and need no substring scan
+        if memory_term in search_set:
+            return True
+        for search_term in search_terms:
+            if search_term in memory_term or memory_term in search_term:
+                return True
+    return False
+
+
 class MemoryService:
     """
     High-level service class for memory operations.
@@ -604,34 +754,7 @@ class MemoryService:
         try:
             self.logger.info(f"Adding memory with {len(content)} characters")
             
-            if self.ai_available and self.processor:
-                # Process text with AI to extract structured information
-                processed_memory = self.processor.process_text_to_memory(
-                    text=content.strip(),
-                    force_title=title
-                )
-                self.logger.info(f"AI processing successful: '{processed_memory.title}'")
-                
-                # Log detailed processing results
-                if processed_memory.dynamic_fields:
-                    field_count = len(processed_memory.dynamic_fields)
-                    field_names = list(processed_memory.dynamic_fields.keys())
-                    self.logger.debug(f"Extracted {field_count} dynamic fields: {field_names}")
-                    self.logger.debug(f"Full dynamic fields: {json.dumps(processed_memory.dynamic_fields, indent=2, default=str)}")
-            else:
-                # Create basic memory without AI processing
-                self.logger.info("AI unavailable - creating basic memory without processing")
-                from info_agent.core.models import Memory
-                processed_memory = Memory(
-                    content=content.strip(),
-                    title=title or self._generate_title(content.strip())
-                )
-                # Add basic dynamic fields
-                processed_memory.dynamic_fields = {
-                    'category': 'general',
-                    'ai_processed': False,
-                    'created_method': 'basic'
-                }
+            processed_memory = self._process_content(content, title)
             
             # Create in database (this also adds to vector store automatically)
             created_memory = self.repository.create(processed_memory)
@@ -646,6 +769,66 @@ class MemoryService:
             self.logger.error(f"Failed to add memory: {e}")
             raise RepositoryError(f"Failed to add memory: {e}")
     
+    def _process_content(self, content: str, title: Optional[str] = None) -> Memory:
+        """
+        Build a Memory from raw text, using AI processing when available.
+        
+        Args:
+            content: Memory content text
+            title: Optional title (will be AI-generated if not provided)
+            
+        Returns:
+            Unsaved Memory object
+        """
+        if self.ai_available and self.processor:
+            # Process text with AI to extract structured information
+            processed_memory = self.processor.process_text_to_memory(
+                text=content.strip(),
+                force_title=title
+            )
+            self.logger.info(f"AI processing successful: '{processed_memory.title}'")
+            
+            # Log detailed processing results
+            if processed_memory.dynamic_fields:
+                field_count = len(processed_memory.dynamic_fields)
+                field_names = list(processed_memory.dynamic_fields.keys())
+                self.logger.debug(f"Extracted {field_count} dynamic fields: {field_names}")
+                self.logger.debug(f"Full dynamic fields: {json.dumps(processed_memory.dynamic_fields, indent=2, default=str)}")
+        else:
+            # Create basic memory without AI processing
+            self.logger.info("AI unavailable - creating basic memory without processing")
+            processed_memory = Memory(
+                content=content.strip(),
+                title=title or self._generate_title(content.strip())
+            )
+            # Add basic dynamic fields
+            processed_memory.dynamic_fields = {
+                'category': 'general',
+                'ai_processed': False,
+                'created_method': 'basic'
+            }
+        
+        return processed_memory
+    
+    def add_memories_bulk(self, items: List[Dict[str, Any]]) -> List[Memory]:
+        """
+        Add multiple memories, storing them in a single database transaction.
+        
+        Args:
+            items: Dicts with 'content' and optional 'title' keys
+            
+        Returns:
+            Created Memory objects in input order
+        """
+        try:
+            self.logger.info(f"Adding {len(items)} memories in bulk")
+            memories = [self._process_content(item['content'], item.get('title')) for item in items]
+            return self.repository.bulk_create(memories)
+            
+        except Exception as e:
+            self.logger.error(f"Failed to add memories: {e}")
+            raise RepositoryError(f"Failed to add memories: {e}")
+    
     def get_memory(self, memory_id: int) -> Optional[Memory]:
         """Get memory by ID."""
         return self.repository.get_by_id(memory_id)
@@ -654,9 +837,14 @@ class MemoryService:
         """Search memories using text search."""
         return self.repository.search(query, limit=limit)
     
-    def semantic_search_memories(self, query: str, limit: int = 20) -> List[MemorySearchResult]:
-        """Search memories using semantic similarity."""
-        return self.repository.semantic_search(query, limit=limit)
+    def search_many(self, queries: List[str], limit: int = 20) -> Dict[str, List[MemorySearchResult]]:
+        """Search memories for several text queries at once."""
+        return self.repository.search_many(queries, limit=limit)
+    
+    def semantic_search_memories(self, query: str, limit: int = 20,
+                                 min_score: Optional[float] = None) -> List[MemorySearchResult]:
+        """Search memories using semantic similarity, optionally dropping results below min_score."""
+        return self.repository.semantic_search(query, limit=limit, min_score=min_score)
     
     def hybrid_search_memories(self, query: str, limit: int = 20) -> List[MemorySearchResult]:
         """Search memories using combined text + semantic search with AI query enhancement."""
@@ -700,49 +888,39 @@ class MemoryService:
             places = analysis.get('places', [])
             field_filters = analysis.get('field_filters', {})
             
+            # Lower-case search terms once per call instead of once per memory term
+            search_categories = _lower_terms(categories)
+            search_people = _lower_terms(people)
+            search_places = _lower_terms(places)
+            
             for result in results:
                 should_include = True
                 
                 # Check category filters
-                if categories and result.memory.dynamic_fields:
+                if search_categories and result.memory.dynamic_fields:
                     memory_categories = result.memory.dynamic_fields.get('categories', [])
                     memory_category = result.memory.dynamic_fields.get('category', '')
                     if memory_categories or memory_category:
                         # Check if any memory category matches search categories
-                        all_memory_cats = memory_categories if isinstance(memory_categories, list) else []
+                        all_memory_cats = list(memory_categories) if isinstance(memory_categories, list) else []
                         if memory_category:
                             all_memory_cats.append(memory_category)
                         
-                        category_match = any(
-                            any(search_cat.lower() in mem_cat.lower() or mem_cat.lower() in search_cat.lower() 
-                                for mem_cat in all_memory_cats)
-                            for search_cat in categories
-                        )
-                        if not category_match:
+                        if not _terms_overlap(search_categories, all_memory_cats):
                             should_include = False
                 
                 # Check people filters
-                if people and result.memory.dynamic_fields and should_include:
+                if search_people and result.memory.dynamic_fields and should_include:
                     memory_people = result.memory.dynamic_fields.get('people', [])
                     if memory_people and isinstance(memory_people, list):
-                        people_match = any(
-                            any(search_person.lower() in mem_person.lower() or mem_person.lower() in search_person.lower()
-                                for mem_person in memory_people)
-                            for search_person in people
-                        )
-                        if not people_match:
+                        if not _terms_overlap(search_people, memory_people):
                             should_include = False
                 
                 # Check places filters
-                if places and result.memory.dynamic_fields and should_include:
+                if search_places and result.memory.dynamic_fields and should_include:
                     memory_places = result.memory.dynamic_fields.get('places', [])
                     if memory_places and isinstance(memory_places, list):
-                        places_match = any(
-                            any(search_place.lower() in mem_place.lower() or mem_place.lower() in search_place.lower()
-                                for mem_place in memory_places)
-                            for search_place in places
-                        )
-                        if not places_match:
+                        if not _terms_overlap(search_places, memory_places):
                             should_include = False
                 
                 # Apply custom field filters
@@ -781,9 +959,18 @@ class MemoryService:
             self.logger.warning(f"Filter application failed, returning unfiltered results: {e}")
             return results[:limit]
     
-    def list_recent_memories(self, limit: int = 20, offset: int = 0) -> List[Memory]:
-        """Get recent memories."""
-        return self.repository.get_recent(limit=limit, offset=offset)
+    def list_recent_memories(self, limit: int = 20, offset: int = 0,
+                             before: Optional[Tuple[str, int]] = None) -> List[Memory]:
+        """Get recent memories, after the (created_at, id) position before if given."""
+        return self.repository.get_recent(limit=limit, offset=offset, before=before)
+    
+    def list_recent_memory_previews(self, limit: int = 20, offset: int = 0,
+                                    before: Optional[Tuple[str, int]] = None,
+                                    preview_length: int = 200) -> List[MemoryPreview]:
+        """Get previews of recent memories with content truncated to preview_length."""
+        return self.repository.get_recent_previews(
+            limit=limit, offset=offset, before=before, preview_length=preview_length
+        )
     
     def update_memory(self, memory: Memory) -> Memory:
         """Update existing memory."""
@@ -852,22 +1039,35 @@ class MemoryService:
 
 
 # Global service instance
-_memory_service: Optional[MemoryService] = None
+@lru_cache(maxsize=1)
+def _create_memory_service(db_path: Optional[str]) -> MemoryService:
+    """Create the memory service for a database path (cached)."""
+    repository = None
+    if db_path is not None:
+        repository = SQLiteMemoryRepository(
+            DatabaseConnection(db_path),
+            VectorStore(VectorStoreConfig(str(Path(db_path).parent)))
+        )
+    return MemoryService(repository)
 
 
-def get_memory_service() -> MemoryService:
+def get_memory_service(db_path: Optional[str] = None) -> MemoryService:
     """
     Get global memory service instance (singleton pattern).
     
+    Args:
+        db_path: Database file path. If None, uses the default location.
+            The vector store is kept in the same directory as the database.
+    
     Returns:
         MemoryService instance
     """
-    global _memory_service
-    
-    if _memory_service is None:
-        _memory_service = MemoryService()
-    
-    return _memory_service
+    return _create_memory_service(db_path)
+
+
+def reset_memory_service():
+    """Drop the cached memory service so the next call creates a new one."""
+    _create_memory_service.cache_clear()
 
 
 # Export main classes and functions
@@ -876,5 +1076,6 @@ __all__ = [
     'SQLiteMemoryRepository', 
     'MemoryService',
     'RepositoryError',
-    'get_memory_service'
+    'get_memory_service',
+    'reset_memory_service'
 ]
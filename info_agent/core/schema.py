@@ -77,6 +77,7 @@ class DatabaseSchema:
     # Indexes for performance optimization
     INDEXES = {
         "idx_memories_created_at": "CREATE INDEX IF NOT EXISTS idx_memories_created_at ON memories(created_at DESC)",
+        "idx_memories_created_id": "CREATE INDEX IF NOT EXISTS idx_memories_created_id ON memories(created_at DESC, id DESC)",
         "idx_memories_updated_at": "CREATE INDEX IF NOT EXISTS idx_memories_updated_at ON memories(updated_at DESC)", 
         "idx_memories_content_hash": "CREATE INDEX IF NOT EXISTS idx_memories_content_hash ON memories(content_hash)",
         "idx_memories_word_count": "CREATE INDEX IF NOT EXISTS idx_memories_word_count ON memories(word_count)",
@@ -5,21 +5,66 @@ This module provides vector storage and similarity search functionality
 for the Info Agent system using ChromaDB as the backend.
 """
 
+import atexit
 import os
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Sequence, Tuple
 from pathlib import Path
-import hashlib
 
-import chromadb
-from chromadb.config import Settings
-from chromadb.utils import embedding_functions
+import numpy as np
 
+from .embedding_cache import EmbeddingCache
 from .models import Memory, MemorySearchResult
+from info_agent.utils.semantic_cache import SemanticCache
+
+# ChromaDB is imported where it is first needed so that importing this
+# module (e.g. for CLI commands that never search) stays cheap
+if TYPE_CHECKING:
+    import chromadb
 
 
 logger = logging.getLogger(__name__)
 
+_fromisoformat = datetime.fromisoformat
+
+# Embedding functions shared by all VectorStore instances, keyed by model
+_embedding_function_cache: Dict[Tuple[str, str], Any] = {}
+_embedding_function_lock = threading.Lock()
+
+# Live VectorStore instances, so queued memories are written before exit
+_live_stores: "weakref.WeakSet[VectorStore]" = weakref.WeakSet()
+
+
+def _flush_live_stores():
+    """Write memories still queued in any VectorStore at interpreter exit."""
+    for store in list(_live_stores):
+        store._flush_pending()
+
+
+atexit.register(_flush_live_stores)
+
+
+def _normalize_rows(embeddings: Any) -> np.ndarray:
+    """Scale embeddings to unit L2 norm, as the inner product space requires.
+    
+    Args:
+        embeddings: Sequence of equal-length embeddings
+        
+    Returns:
+        float32 matrix with one unit-norm row per embedding
+    """
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
 
 class VectorStoreConfig:
     """Configuration for ChromaDB vector store."""
@@ -36,13 +81,49 @@ class VectorStoreConfig:
         self.data_dir = Path(data_dir)
         self.collection_name = "memories"
         self.embedding_model = "all-MiniLM-L6-v2"  # Lightweight, good performance
+        # INT8-quantized ONNX export of the model (AVX-512 VNNI kernels)
+        self.embedding_onnx_file = "onnx/model_qint8_avx512_vnni.onnx"
+        # Number of memories queue_memory holds before embedding them together
+        self.pending_flush_size = 32
+        # Query embeddings kept in memory
+        self.query_embedding_cache_size = 2048
+        # On-disk cache of computed embeddings, shared by all stores and runs.
+        # Off by default: it stores embeddings of memory content outside the
+        # data directory and is never pruned, so only test configs enable it.
+        self.persist_embeddings = False
+        self.embedding_cache_path = Path(os.path.expanduser("~/.cache/info_agent/embeddings.db"))
+        # Search result cache: entry limit and cosine similarity for near-duplicate hits
+        self.query_cache_size = 1024
+        self.query_cache_threshold = 0.98
+        # Seconds cached search results stay valid; our own writes clear
+        # them immediately, the TTL covers writes by other processes
+        self.query_cache_ttl = 30.0
+        # HNSW index parameters, applied when the collection is created
+        self.hnsw_M = 24
+        self.hnsw_ef_construction = 128
+        self.hnsw_ef_search = 100
+        # Searches fetch this many times the requested results from the
+        # approximate index and keep the best after exact re-ranking
+        self.rerank_overfetch = 5
+        # Maximum number of memories written per collection.add call
+        self.add_batch_size = 200
+        # Failed writes after which a memory is dropped instead of retried
+        self.max_add_attempts = 3
+        # Seconds a cached document count stays valid; our own writes
+        # invalidate it immediately, the TTL covers other processes
+        self.stats_cache_ttl = 5.0
         
         # Ensure data directory exists
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
 
 class VectorStore:
-    """ChromaDB-based vector store for semantic search."""
+    """ChromaDB-based vector store for semantic search.
+    
+    Instances are safe to share between threads: collection setup is
+    serialized, and ChromaDB >= 1.0 runs add/query in its Rust core without
+    holding the GIL, so concurrent request handlers can write in parallel.
+    """
     
     def __init__(self, config: Optional[VectorStoreConfig] = None):
         """Initialize the vector store.
@@ -54,13 +135,41 @@ class VectorStore:
         self._client = None
         self._collection = None
         self._embedding_function = None
+        self._init_lock = threading.RLock()
+        # Memories queued by queue_memory, written in batches
+        self._pending: List[Tuple[Memory, Optional[List[float]]]] = []
+        self._pending_lock = threading.Lock()
+        # Failed write attempts per memory ID, for memories awaiting retry
+        self._add_failures: Dict[int, int] = {}
+        _live_stores.add(self)
+        # Query embeddings by text; they do not depend on the collection
+        self._embed_query = lru_cache(maxsize=self.config.query_embedding_cache_size)(
+            self._compute_query_embedding
+        )
+        self._embedding_cache = (
+            EmbeddingCache(self.config.embedding_cache_path)
+            if self.config.persist_embeddings else None
+        )
+        # Bumped whenever the collection changes, so callers can key caches on it
+        self.generation = 0
+        # Document count as (generation, monotonic time, count)
+        self._count_cache: Optional[Tuple[int, float, int]] = None
+        # Cached search results, cleared whenever the collection changes
+        self._query_cache = SemanticCache(
+            threshold=self.config.query_cache_threshold,
+            max_size=self.config.query_cache_size,
+            ttl=self.config.query_cache_ttl
+        )
         
         logger.info(f"Vector store initialized with data dir: {self.config.data_dir}")
     
-    def _get_client(self) -> chromadb.ClientAPI:
+    def _get_client(self) -> "chromadb.ClientAPI":
         """Get or create ChromaDB client."""
         if self._client is None:
             try:
+                import chromadb
+                from chromadb.config import Settings
+                
                 # Create persistent client
                 self._client = chromadb.PersistentClient(
                     path=str(self.config.data_dir / "chromadb"),
@@ -77,56 +186,160 @@ class VectorStore:
         return self._client
     
     def _get_embedding_function(self):
-        """Get or create embedding function."""
+        """Get or create embedding function.
+        
+        Embedding functions are shared process-wide per model, so several
+        VectorStore instances do not each load their own copy of the model.
+        """
         if self._embedding_function is None:
+            cache_key = (self.config.embedding_model, self.config.embedding_onnx_file)
+            with _embedding_function_lock:
+                if cache_key not in _embedding_function_cache:
+                    _embedding_function_cache[cache_key] = self._create_embedding_function()
+                self._embedding_function = _embedding_function_cache[cache_key]
+        
+        return self._embedding_function
+    
+    def _create_embedding_function(self):
+        """Create the embedding function for the configured model.
+        
+        All embedding functions returned here produce unit-norm vectors,
+        which the inner product index space relies on. Stored and query
+        embeddings are normalized again before use, so precomputed
+        embeddings and fallback models are safe too.
+        """
+        from chromadb.utils import embedding_functions
+        from .embeddings import OnnxSentenceTransformerEmbeddingFunction
+        
+        try:
+            # Prefer the quantized ONNX backend for faster CPU inference
+            embedding_function = OnnxSentenceTransformerEmbeddingFunction(
+                model_name=self.config.embedding_model,
+                file_name=self.config.embedding_onnx_file
+            )
+            logger.debug(f"ONNX embedding function created with model: {self.config.embedding_model}")
+        except Exception as e:
+            logger.warning(f"ONNX embedding backend unavailable, using PyTorch backend: {e}")
             try:
                 # Use sentence transformers embedding function
-                self._embedding_function = embedding_functions.SentenceTransformerEmbeddingFunction(
-                    model_name=self.config.embedding_model
+                embedding_function = embedding_functions.SentenceTransformerEmbeddingFunction(
+                    model_name=self.config.embedding_model,
+                    normalize_embeddings=True
                 )
                 logger.debug(f"Embedding function created with model: {self.config.embedding_model}")
             except Exception as e:
                 logger.error(f"Failed to create embedding function: {e}")
                 # Fallback to default embedding function
-                self._embedding_function = embedding_functions.DefaultEmbeddingFunction()
+                embedding_function = embedding_functions.DefaultEmbeddingFunction()
                 logger.warning("Using default embedding function as fallback")
         
-        return self._embedding_function
+        return embedding_function
+    
+    def _invalidate_caches(self):
+        """Drop cached search results after the collection changed."""
+        self._query_cache.clear()
+        self.generation += 1
+    
+    def embed_query(self, query: str) -> List[float]:
+        """Embed a search query (memoized).
+        
+        Args:
+            query: Search query text
+            
+        Returns:
+            Unit-norm query embedding
+        """
+        return list(self._embed_query(query))
+    
+    def _compute_query_embedding(self, query: str) -> Tuple[float, ...]:
+        """Embed a search query; called through the memoizing ``self._embed_query``."""
+        return tuple(self._embed_texts([query])[0].tolist())
+    
+    def _embed_texts(self, texts: List[str]) -> np.ndarray:
+        """Embed texts, reusing embeddings from the on-disk cache if enabled.
+        
+        Only texts missing from the cache are run through the embedding
+        function, in one batch; their embeddings are then cached.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            float32 matrix with one unit-norm row per text
+        """
+        embedding_function = self._get_embedding_function()
+        if self._embedding_cache is None:
+            return _normalize_rows(embedding_function(texts))
+        
+        # Different backends produce different vectors for the same model name
+        model = (f"{type(embedding_function).__name__}|{self.config.embedding_model}"
+                 f"|{self.config.embedding_onnx_file}")
+        keys = [EmbeddingCache.key(model, text) for text in texts]
+        cached = self._embedding_cache.get_many(keys)
+        
+        missing = {key: text for key, text in zip(keys, texts) if key not in cached}
+        if missing:
+            computed = _normalize_rows(embedding_function(list(missing.values())))
+            new_embeddings = dict(zip(missing, computed))
+            self._embedding_cache.put_many(new_embeddings)
+            cached.update(new_embeddings)
+        
+        return np.stack([cached[key] for key in keys])
     
     def _get_collection(self):
         """Get or create the memories collection."""
-        if self._collection is None:
-            try:
-                client = self._get_client()
-                embedding_function = self._get_embedding_function()
-                
-                # Try to get existing collection first
+        # Serialize lazy initialization so concurrent callers share one collection
+        with self._init_lock:
+            if self._collection is None:
                 try:
-                    self._collection = client.get_collection(
-                        name=self.config.collection_name,
-                        embedding_function=embedding_function
-                    )
-                    logger.debug(f"Retrieved existing collection: {self.config.collection_name}")
-                except Exception as e:
-                    # Collection doesn't exist, create it
-                    logger.debug(f"Collection doesn't exist, creating: {e}")
+                    client = self._get_client()
+                    embedding_function = self._get_embedding_function()
+                    
+                    # Try to get existing collection first
                     try:
-                        self._collection = client.create_collection(
+                        self._collection = client.get_collection(
                             name=self.config.collection_name,
-                            embedding_function=embedding_function,
-                            metadata={"hnsw:space": "cosine"}  # Use cosine similarity
+                            embedding_function=embedding_function
                         )
-                        logger.info(f"Created new collection: {self.config.collection_name}")
-                    except Exception as create_error:
-                        logger.error(f"Failed to create collection: {create_error}")
-                        raise
-                    
-            except Exception as e:
-                logger.error(f"Failed to get/create collection: {e}")
-                raise
+                        logger.debug(f"Retrieved existing collection: {self.config.collection_name}")
+                    except Exception as e:
+                        # Collection doesn't exist, create it
+                        logger.debug(f"Collection doesn't exist, creating: {e}")
+                        try:
+                            self._collection = client.create_collection(
+                                name=self.config.collection_name,
+                                embedding_function=embedding_function,
+                                metadata={
+                                    # Embeddings are unit-norm, so inner product equals cosine similarity
+                                    "hnsw:space": "ip",
+                                    "hnsw:M": self.config.hnsw_M,
+                                    "hnsw:construction_ef": self.config.hnsw_ef_construction,
+                                    "hnsw:search_ef": self.config.hnsw_ef_search
+                                }
+                            )
+                            logger.info(f"Created new collection: {self.config.collection_name}")
+                        except Exception as create_error:
+                            logger.error(f"Failed to create collection: {create_error}")
+                            raise
+                        
+                except Exception as e:
+                    logger.error(f"Failed to get/create collection: {e}")
+                    raise
         
         return self._collection
     
+    def _create_embedding_text(self, memory: Memory) -> str:
+        """Create the text that is embedded for a memory (title + content).
+        
+        Only the content is stored as the document, the title already lives
+        in the metadata.
+        """
+        return f"{memory.title}\n{memory.content}" if memory.title else memory.content
+    
+    def _create_snippet(self, document: str) -> str:
+        """Create a search result snippet from document text."""
+        return document[:200] + "..." if len(document) > 200 else document
+    
     def _create_metadata_for_chromadb(self, memory: Memory) -> Dict[str, Any]:
         """Create ChromaDB-compatible metadata from Memory object.
         
@@ -140,7 +353,9 @@ class VectorStore:
             "version": memory.version,
             "created_at": memory.created_at.isoformat() if memory.created_at else "",
             "updated_at": memory.updated_at.isoformat() if memory.updated_at else "",
-            "content_hash": memory.content_hash or ""
+            "content_hash": memory.content_hash or "",
+            # Lets searches build snippets without fetching documents
+            "snippet_preview": self._create_snippet(memory.content)
         }
         
         # Add dynamic fields to metadata if available
@@ -164,116 +379,305 @@ class VectorStore:
         Returns:
             Memory object reconstructed from stored data
         """
-        from datetime import datetime
+        get = metadata.get
         
         # Parse timestamps
-        created_at = None
-        if metadata.get('created_at'):
-            try:
-                created_at = datetime.fromisoformat(metadata['created_at'])
-            except (ValueError, TypeError):
-                pass
-                
-        updated_at = None
-        if metadata.get('updated_at'):
-            try:
-                updated_at = datetime.fromisoformat(metadata['updated_at'])
-            except (ValueError, TypeError):
-                pass
+        created_at = get('created_at')
+        updated_at = get('updated_at')
+        try:
+            created_at = _fromisoformat(created_at) if created_at else None
+        except (ValueError, TypeError):
+            created_at = None
+        try:
+            updated_at = _fromisoformat(updated_at) if updated_at else None
+        except (ValueError, TypeError):
+            updated_at = None
         
         # Extract dynamic fields (they're prefixed with 'dynamic_')
-        dynamic_fields = {}
-        for key, value in metadata.items():
-            if key.startswith('dynamic_'):
-                field_name = key[8:]  # Remove 'dynamic_' prefix
-                dynamic_fields[field_name] = value
-        
-        # Extract title and content from document
-        # Document format is "title\ncontent" or just "content"
-        lines = document.split('\n', 1)
-        if len(lines) > 1 and lines[0] == metadata.get('title', ''):
-            title = lines[0]
-            content = lines[1]
-        else:
-            title = metadata.get('title', '')
-            content = document
+        dynamic_fields = {
+            key[8:]: value  # Remove 'dynamic_' prefix
+            for key, value in metadata.items()
+            if key.startswith('dynamic_')
+        }
+        
+        # Document is the content; the title comes from metadata
+        title = get('title', '')
+        content = document
+        if title and document.startswith(title + '\n'):
+            # Entries written before titles were dropped from documents
+            content = document[len(title) + 1:]
         
         return Memory(
-            id=metadata.get('memory_id'),
+            id=get('memory_id'),
             title=title,
             content=content,
             dynamic_fields=dynamic_fields,
-            content_hash=metadata.get('content_hash'),
-            word_count=metadata.get('word_count', 0),
+            content_hash=get('content_hash'),
+            word_count=get('word_count', 0),
             created_at=created_at,
             updated_at=updated_at,
-            version=metadata.get('version', 1)
+            version=get('version', 1)
         )
     
-    def add_memory(self, memory: Memory) -> bool:
-        """Add a memory to the vector store.
+    def add_memory(self, memory: Memory, embedding: Optional[List[float]] = None) -> bool:
+        """Add a single memory to the vector store.
+        
+        Memories queued by ``queue_memory`` are written in the same batch.
         
         Args:
             memory: Memory object to add
+            embedding: Precomputed embedding (normalized on write). If given, the
+                embedding function is not run for this memory.
             
         Returns:
             bool: True if successful, False otherwise
         """
-        try:
-            collection = self._get_collection()
-            
-            # Create document ID (use memory ID for consistency)
-            doc_id = f"memory_{memory.id}"
-            
-            # Prepare content for embedding (title + content)
-            content_text = f"{memory.title}\n{memory.content}" if memory.title else memory.content
+        return self.add_memories([memory], None if embedding is None else [embedding])
+    
+    def queue_memory(self, memory: Memory, embedding: Optional[List[float]] = None) -> bool:
+        """Queue a memory for addition to the vector store, for bulk loaders.
+        
+        Queued memories are embedded and written together once
+        ``config.pending_flush_size`` of them are waiting, or before the
+        next add, search, update or delete. Until then they are not visible
+        to other processes, so callers that need the memory searchable
+        right away should use ``add_memory``.
+        
+        Args:
+            memory: Memory object to add
+            embedding: Precomputed embedding (normalized on write). If given, the
+                embedding function is not run for this memory.
             
-            # Create metadata for ChromaDB (flattened, no complex types)
-            metadata = self._create_metadata_for_chromadb(memory)
+        Returns:
+            bool: True if queued (or flushed) successfully, False if the
+                flush failed; failed memories stay queued for the next flush
+        """
+        self._invalidate_caches()
+        with self._pending_lock:
+            self._pending.append((memory, embedding))
+            if len(self._pending) < self.config.pending_flush_size:
+                return True
+        return self._flush_pending()
+    
+    def add_memories(
+        self,
+        memories: List[Memory],
+        embeddings: Optional[List[List[float]]] = None
+    ) -> bool:
+        """Add multiple memories to the vector store in a single batch.
+        
+        Embedding the whole batch in one call is much cheaper than adding
+        memories one at a time. Memories queued by ``queue_memory`` are
+        written in the same batch. Large batches are written in chunks of
+        ``config.add_batch_size`` memories.
+        
+        Args:
+            memories: Memory objects to add
+            embeddings: Precomputed embeddings (normalized on write), one per memory.
+                If given, the embedding function is not run.
             
-            # Add to collection
-            collection.add(
-                documents=[content_text],
-                metadatas=[metadata],
-                ids=[doc_id]
-            )
+        Returns:
+            bool: True if successful, False otherwise
             
-            logger.debug(f"Added memory {memory.id} to vector store")
+        Raises:
+            ValueError: If embeddings and memories differ in length
+        """
+        if embeddings is not None and len(embeddings) != len(memories):
+            raise ValueError(f"Got {len(embeddings)} embeddings for {len(memories)} memories")
+        
+        with self._pending_lock:
+            entries, self._pending = self._pending, []
+        if embeddings is None:
+            embeddings = [None] * len(memories)
+        entries.extend(zip(memories, embeddings))
+        return self._write_memories(entries)
+    
+    def _flush_pending(self) -> bool:
+        """Write all memories queued by queue_memory in one batch.
+        
+        Returns:
+            bool: True if successful (or nothing was queued), False otherwise
+        """
+        with self._pending_lock:
+            entries, self._pending = self._pending, []
+        return self._write_memories(entries)
+    
+    def _write_memories(self, entries: List[Tuple[Memory, Optional[List[float]]]]) -> bool:
+        """Embed and add (memory, embedding) pairs to the collection.
+        
+        Memories without a precomputed embedding are embedded together in
+        one call per chunk. A failed chunk does not stop the later ones; its
+        memories are queued again so the next flush retries them, until a
+        memory has failed max_add_attempts times and is dropped.
+        
+        Returns:
+            bool: True if every memory was written, False otherwise
+        """
+        if not entries:
             return True
+        
+        # Sort by length so similarly sized documents share padding
+        entries = sorted(entries, key=lambda entry: len(entry[0].content or ""), reverse=True)
+        chunk_size = self.config.add_batch_size
+        written = 0
+        failed: List[Tuple[Memory, Optional[List[float]]]] = []
+        try:
+            for start in range(0, len(entries), chunk_size):
+                chunk = entries[start:start + chunk_size]
+                try:
+                    self._write_chunk(chunk)
+                except Exception as e:
+                    failed.extend(chunk)
+                    logger.error("Failed to add memories %s to vector store: %s",
+                                 [memory.id for memory, _ in chunk], e)
+                    continue
+                written += len(chunk)
+                with self._pending_lock:
+                    for memory, _ in chunk:
+                        self._add_failures.pop(memory.id, None)
+        finally:
+            if written:
+                self._invalidate_caches()
+        
+        if not failed:
+            logger.debug("Added memories %s to vector store", [memory.id for memory, _ in entries])
+            return True
+        
+        retry = []
+        dropped = []
+        with self._pending_lock:
+            for memory, embedding in failed:
+                attempts = self._add_failures.get(memory.id, 0) + 1
+                if attempts < self.config.max_add_attempts:
+                    self._add_failures[memory.id] = attempts
+                    retry.append((memory, embedding))
+                else:
+                    self._add_failures.pop(memory.id, None)
+                    dropped.append(memory.id)
+            self._pending[:0] = retry
+        if retry:
+            logger.warning("Queued memories %s for retry", [memory.id for memory, _ in retry])
+        if dropped:
+            logger.error("Dropped memories %s after %d failed attempts to add them",
+                         dropped, self.config.max_add_attempts)
+        return False
+    
+    def _write_chunk(self, chunk: List[Tuple[Memory, Optional[List[float]]]]) -> None:
+        """Embed and add one chunk of (memory, embedding) pairs in a single call.
+        
+        Raises:
+            Exception: If embedding or adding to the collection fails
+        """
+        collection = self._get_collection()
+        batch = [memory for memory, _ in chunk]
+        batch_embeddings = [embedding for _, embedding in chunk]
+        
+        missing = [i for i, embedding in enumerate(batch_embeddings) if embedding is None]
+        if missing:
+            # Embed title + content, but store only the content
+            computed = self._embed_texts(
+                [self._create_embedding_text(batch[i]) for i in missing]
+            )
+            for i, embedding in zip(missing, computed):
+                batch_embeddings[i] = embedding
+        batch_embeddings = _normalize_rows(batch_embeddings)
+        
+        documents = [memory.content for memory in batch]
+        # Create metadata for ChromaDB (flattened, no complex types)
+        metadatas = [self._create_metadata_for_chromadb(memory) for memory in batch]
+        # Create document IDs (use memory ID for consistency)
+        ids = [f"memory_{memory.id}" for memory in batch]
+        
+        # Add to collection
+        collection.add(
+            documents=documents,
+            metadatas=metadatas,
+            ids=ids,
+            embeddings=batch_embeddings
+        )
+    
+    def add_memories_parallel(
+        self,
+        memories: List[Memory],
+        batch_size: int = 32,
+        workers: int = 4
+    ) -> bool:
+        """Add many memories using several threads, for bulk ingestion.
+        
+        The memories are split into batches that are embedded and added
+        concurrently. ONNX Runtime inference and ChromaDB's Rust core both
+        release the GIL, so batches run in parallel across CPU cores.
+        
+        Args:
+            memories: Memory objects to add
+            batch_size: Number of memories per batch
+            workers: Number of worker threads
             
-        except Exception as e:
-            logger.error(f"Failed to add memory {memory.id} to vector store: {e}")
-            return False
+        Returns:
+            bool: True if every batch was added successfully
+        """
+        batches = [memories[i:i + batch_size] for i in range(0, len(memories), batch_size)]
+        if len(batches) <= 1:
+            return self.add_memories(memories)
+        
+        # Initialize the collection once before the workers share it
+        self._get_collection()
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self.add_memories, batches))
+        
+        logger.debug("Added %s memories in %s parallel batches", len(memories), len(batches))
+        return all(results)
     
-    def update_memory(self, memory: Memory) -> bool:
+    def update_memory(self, memory: Memory, embedding: Optional[List[float]] = None) -> bool:
         """Update an existing memory in the vector store.
         
+        The embedding is only recomputed when the embedded text (title and
+        content) changed; metadata-only updates keep the stored embedding.
+        
         Args:
             memory: Updated memory object
+            embedding: Precomputed embedding (normalized on write) used if the text
+                changed, instead of running the embedding function
             
         Returns:
             bool: True if successful, False otherwise
         """
+        self._flush_pending()
+        
         try:
-            # For ChromaDB, we need to delete and re-add to update
             doc_id = f"memory_{memory.id}"
             collection = self._get_collection()
+            metadata = self._create_metadata_for_chromadb(memory)
             
-            # Check if document exists
-            try:
-                collection.get(ids=[doc_id])
-                # If we get here, document exists, so delete it first
-                collection.delete(ids=[doc_id])
-                logger.debug(f"Deleted existing memory {memory.id} from vector store")
-            except Exception:
-                # Document doesn't exist, that's fine
-                pass
+            existing = collection.get(ids=[doc_id], include=["metadatas"])
+            stored = existing['metadatas'][0] if existing['metadatas'] else None
             
-            # Add the updated memory
-            return self.add_memory(memory)
+            # Hash the current content, memory.content_hash may predate an edit
+            content_hash = memory._generate_content_hash() if memory.content else None
+            
+            if (stored and content_hash
+                    and stored.get('content_hash') == content_hash
+                    and stored.get('title') == metadata['title']):
+                # Text unchanged, ChromaDB keeps the existing embedding
+                collection.update(ids=[doc_id], metadatas=[metadata])
+                logger.debug("Updated metadata for memory %s in vector store", memory.id)
+            else:
+                if embedding is None:
+                    embedding = self._embed_texts([self._create_embedding_text(memory)])[0]
+                collection.upsert(
+                    ids=[doc_id],
+                    documents=[memory.content],
+                    metadatas=[metadata],
+                    embeddings=_normalize_rows([embedding])
+                )
+                logger.debug("Re-embedded memory %s in vector store", memory.id)
+            
+            self._invalidate_caches()
+            return True
             
         except Exception as e:
-            logger.error(f"Failed to update memory {memory.id} in vector store: {e}")
+            logger.error("Failed to update memory %s in vector store: %s", memory.id, e)
             return False
     
     def delete_memory(self, memory_id: int) -> bool:
@@ -285,23 +689,28 @@ class VectorStore:
         Returns:
             bool: True if successful, False otherwise
         """
+        self._flush_pending()
+        
         try:
             collection = self._get_collection()
             doc_id = f"memory_{memory_id}"
             
             collection.delete(ids=[doc_id])
-            logger.debug(f"Deleted memory {memory_id} from vector store")
+            self._invalidate_caches()
+            logger.debug("Deleted memory %s from vector store", memory_id)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to delete memory {memory_id} from vector store: {e}")
+            logger.error("Failed to delete memory %s from vector store: %s", memory_id, e)
             return False
     
     def search_memories(
         self, 
         query: str, 
         limit: int = 10,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        include_documents: bool = True,
+        min_score: Optional[float] = None
     ) -> List[MemorySearchResult]:
         """Search for memories using semantic similarity.
         
@@ -309,10 +718,16 @@ class VectorStore:
             query: Search query text
             limit: Maximum number of results to return
             filters: Optional metadata filters
+            include_documents: Fetch full documents. If False, result memories
+                have empty content and snippets come from stored metadata.
+            min_score: Drop results with a lower cosine similarity. Filtered
+                on the score array, before any result objects are built.
             
         Returns:
             List of MemorySearchResult objects with metadata and similarity scores
         """
+        self._flush_pending()
+        
         try:
             collection = self._get_collection()
             
@@ -326,54 +741,120 @@ class VectorStore:
                     else:
                         where_clause[key] = value
             
-            # Perform similarity search
+            # Serve repeated and near-duplicate queries from the cache
+            cache_key = (query, limit, repr(filters), include_documents, min_score)
+            cache_namespace = cache_key[1:]
+            cached_results = self._query_cache.get(cache_key)
+            if cached_results is None:
+                query_embedding = self._embed_query(query)
+                cached_results = self._query_cache.get_similar(query_embedding, cache_namespace)
+            if cached_results is not None:
+                logger.debug("Vector search for '%s' served from query cache", query)
+                return [replace(result) for result in cached_results]
+            
+            # Over-fetch candidates from the approximate HNSW index, then
+            # re-rank them exactly against the stored embeddings
+            include = ["metadatas", "embeddings"]
+            if include_documents:
+                include.append("documents")
             results = collection.query(
-                query_texts=[query],
-                n_results=limit,
+                query_embeddings=[list(query_embedding)],
+                n_results=limit * self.config.rerank_overfetch,
                 where=where_clause,
-                include=["documents", "metadatas", "distances"]
+                include=include
             )
             
             # Format results as MemorySearchResult objects
             search_results = []
             if results['ids'] and results['ids'][0]:  # Check if we have results
-                for i in range(len(results['ids'][0])):
-                    metadata = results['metadatas'][0][i]
-                    document = results['documents'][0][i]
-                    distance = results['distances'][0][i]
-                    
-                    # Create a minimal Memory object from metadata
-                    memory = self._create_memory_from_metadata(metadata, document)
-                    
-                    # Create content preview
-                    content_preview = document[:200] + "..." if len(document) > 200 else document
-                    
-                    # Create search result
-                    search_result = MemorySearchResult(
-                        memory=memory,
-                        relevance_score=1.0 - distance,  # Convert distance to similarity
+                order, scores = self._rerank_candidates(query_embedding, results['embeddings'][0], limit)
+                if min_score is not None:
+                    keep = scores >= min_score
+                    order, scores = order[keep], scores[keep]
+                metadatas = [results['metadatas'][0][i] for i in order]
+                if include_documents:
+                    documents = [results['documents'][0][i] for i in order]
+                    snippets = [self._create_snippet(document) for document in documents]
+                else:
+                    documents = [""] * len(metadatas)
+                    snippets = [metadata.get('snippet_preview', '') for metadata in metadatas]
+                
+                search_results = [
+                    MemorySearchResult(
+                        memory=self._create_memory_from_metadata(metadata, document),
+                        relevance_score=score,
                         match_type="semantic",
                         matched_fields=["content", "title"],
-                        snippet=content_preview
+                        snippet=snippet
                     )
-                    search_results.append(search_result)
+                    for metadata, document, score, snippet
+                    in zip(metadatas, documents, scores.tolist(), snippets)
+                ]
+            
+            self._query_cache.put(cache_key, query_embedding, search_results, cache_namespace)
             
-            logger.debug(f"Vector search for '{query}' returned {len(search_results)} results")
-            return search_results
+            logger.debug("Vector search for '%s' returned %s results", query, len(search_results))
+            return [replace(result) for result in search_results]
             
         except Exception as e:
-            logger.error(f"Failed to search memories with query '{query}': {e}")
+            logger.error("Failed to search memories with query '%s': %s", query, e)
             return []
     
+    def _rerank_candidates(
+        self,
+        query_embedding: Sequence[float],
+        candidates: Any,
+        k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score candidate embeddings exactly against the query and keep the best k.
+        
+        Stored and query embeddings are unit-norm, so one matrix-vector
+        product gives the cosine similarity of every candidate.
+        
+        Args:
+            query_embedding: Unit-norm query embedding
+            candidates: Candidate embeddings, one row per candidate
+            k: Number of candidates to keep
+            
+        Returns:
+            Indices of the best candidates (best first) and their cosine similarities
+        """
+        scores = np.asarray(candidates, dtype=np.float32) @ np.asarray(query_embedding, dtype=np.float32)
+        return self._top_k(scores, k)
+    
+    @staticmethod
+    def _top_k(scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Select the k highest scores, best first, without sorting the rest."""
+        if len(scores) > k:
+            top = np.argpartition(-scores, k)[:k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return top, scores[top]
+    
+    def _document_count(self) -> int:
+        """Count stored documents, reusing the last count while it is valid."""
+        cached = self._count_cache
+        now = time.monotonic()
+        if (cached is not None and cached[0] == self.generation
+                and now - cached[1] < self.config.stats_cache_ttl):
+            return cached[2]
+        
+        generation = self.generation
+        count = self._get_collection().count()
+        self._count_cache = (generation, now, count)
+        return count
+    
     def get_collection_stats(self) -> Dict[str, Any]:
         """Get statistics about the vector store collection.
         
         Returns:
             Dictionary with collection statistics
         """
+        self._flush_pending()
+        
         try:
-            collection = self._get_collection()
-            count = collection.count()
+            count = self._document_count()
             
             return {
                 "total_documents": count,
@@ -411,11 +892,16 @@ class VectorStore:
                 # Collection doesn't exist, that's fine
                 pass
             
-            # Reset internal references
-            self._collection = None
-            
-            # Create new collection
-            self._get_collection()
+            with self._init_lock:
+                # Reset internal references
+                self._collection = None
+                self._invalidate_caches()
+                with self._pending_lock:
+                    self._pending.clear()
+                    self._add_failures.clear()
+                
+                # Create new collection
+                self._get_collection()
             logger.info(f"Reset collection: {self.config.collection_name}")
             return True
             
@@ -458,6 +944,16 @@ def initialize_vector_store(config: Optional[VectorStoreConfig] = None) -> bool:
     try:
         vector_store = get_vector_store(config)
         stats = vector_store.get_collection_stats()
+        
+        # Warm up the model and index so the first user query doesn't pay for it
+        try:
+            start_time = time.perf_counter()
+            vector_store._get_embedding_function()(["warmup"])
+            vector_store.search_memories("warmup", limit=1)
+            logger.info(f"Vector store warmed up in {time.perf_counter() - start_time:.2f}s")
+        except Exception as e:
+            logger.warning(f"Vector store warmup failed: {e}")
+        
         logger.info(f"Vector store initialized successfully: {stats}")
         return True
         
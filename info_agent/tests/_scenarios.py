@@ -0,0 +1,46 @@
+"""
+Realistic text scenarios shared by the Info Agent tests.
+
+Each scenario has a unique name (used as the test id), the text to
+process and the elements the text is expected to contain.
+"""
+
+from typing import Dict, List, Union
+
+SCENARIOS: List[Dict[str, Union[str, List[str]]]] = [
+    {
+        "name": "Meeting Notes",
+        "text": "Weekly team sync - discussed Q3 roadmap, Sarah presented user research findings, decided to prioritize mobile app features. Action items: schedule design review (John), update project timeline (Maria), get stakeholder approval by Friday.",
+        "expected_elements": ["roadmap", "Sarah", "mobile app", "Friday"]
+    },
+    {
+        "name": "Standup Meeting",
+        "text": "Team standup meeting - Sarah completed the user interface mockups, John is working on database optimization, Maria will start integration testing tomorrow. Next meeting scheduled for Friday at 10am.",
+        "expected_elements": ["Sarah", "database", "Friday"]
+    },
+    {
+        "name": "Task Reminder",
+        "text": "Reminder: Complete tax filing before April 15th deadline. Need to gather W-2 forms, investment statements, and receipts for business expenses. Consider consulting with accountant if needed.",
+        "expected_elements": ["April 15th", "tax filing", "W-2 forms", "accountant"]
+    },
+    {
+        "name": "Maintenance Reminder",
+        "text": "Remember to backup production database before the maintenance window on Saturday at 3am. Also need to notify all users about the planned downtime via email and slack.",
+        "expected_elements": ["Saturday", "backup", "maintenance"]
+    },
+    {
+        "name": "Learning Note",
+        "text": "Completed Chapter 5 of Machine Learning book covering neural networks and backpropagation. Key concepts: gradient descent optimization, activation functions (ReLU, sigmoid), overfitting prevention. Practice problems assigned for next week.",
+        "expected_elements": ["neural networks", "gradient descent", "next week", "Machine Learning"]
+    },
+    {
+        "name": "Course Note",
+        "text": "Completed Python course module on decorators and context managers. Key concepts: @wraps decorator, __enter__ and __exit__ methods, with statement usage. Practice exercises due next Tuesday.",
+        "expected_elements": ["Python", "decorators", "Tuesday"]
+    },
+    {
+        "name": "Project Update",
+        "text": "Database migration completed successfully last night at 2 AM. All tables transferred, indexes rebuilt, performance tests passed. Website is back online with 15% faster query response times. Monitoring for any issues over next 48 hours.",
+        "expected_elements": ["2 AM", "15% faster", "48 hours", "migration"]
+    }
+]
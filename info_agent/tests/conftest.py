@@ -0,0 +1,206 @@
+"""
+Shared pytest fixtures for Info Agent tests.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest.mock import Mock, patch
+
+import pytest
+
+from info_agent.core import database, repository, vector_store
+from info_agent.core.database import DatabaseConnection
+from info_agent.core.migrations import initialize_database
+from info_agent.core.repository import SQLiteMemoryRepository, MemoryService
+from info_agent.core.vector_store import VectorStore
+from info_agent.tests.fakes import small_vector_store_config
+
+
+# Set INFO_AGENT_TEST_PROFILE to a file path to record per-test timings
+_PROFILE_PATH = os.environ.get("INFO_AGENT_TEST_PROFILE")
+_profile_results: List[Dict[str, Any]] = []
+_statement_count = 0
+
+
+def _count_statement(statement: str):
+    """SQLite trace callback counting executed statements."""
+    global _statement_count
+    _statement_count += 1
+
+
+@pytest.fixture(autouse=True)
+def _profile_test(request, monkeypatch):
+    """
+    Record wall time, SQLite statements and peak memory for each test.
+
+    Only active when INFO_AGENT_TEST_PROFILE is set. Statements are counted
+    on connections opened while profiling, so connections reused from
+    before profiling started are not traced. Timings include
+    function-scoped fixture setup and teardown.
+    """
+    if not _PROFILE_PATH:
+        yield
+        return
+
+    real_connect = sqlite3.connect
+
+    def traced_connect(*args, **kwargs):
+        conn = real_connect(*args, **kwargs)
+        conn.set_trace_callback(_count_statement)
+        return conn
+
+    monkeypatch.setattr(sqlite3, 'connect', traced_connect)
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    statements_before = _statement_count
+    start = time.perf_counter()
+
+    yield
+
+    _profile_results.append({
+        "nodeid": request.node.nodeid,
+        "duration": time.perf_counter() - start,
+        "sqlite_statements": _statement_count - statements_before,
+        "peak_memory_bytes": tracemalloc.get_traced_memory()[1],
+    })
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Write collected per-test profile results as JSON."""
+    if _PROFILE_PATH and _profile_results:
+        tracemalloc.stop()
+        with open(_PROFILE_PATH, "w") as f:
+            json.dump({"tests": _profile_results}, f, indent=2)
+
+
+def _fast_tmpdir(prefix: str) -> tempfile.TemporaryDirectory:
+    """Create a temporary directory, on tmpfs (/dev/shm) when available."""
+    shm = Path("/dev/shm")
+    return tempfile.TemporaryDirectory(prefix=prefix, dir=shm if shm.is_dir() else None,
+                                       ignore_cleanup_errors=True)
+
+
+@pytest.fixture(scope="session")
+def test_home():
+    """
+    Point HOME at a temporary directory for the test session.
+
+    Singletons created under the real HOME by earlier tests are dropped,
+    so nothing in the session falls back to the user's own data.
+    """
+    with _fast_tmpdir("info_agent_test_home_") as name, pytest.MonkeyPatch.context() as mp:
+        test_dir = Path(name)
+        mp.setenv('HOME', str(test_dir))
+        mp.setenv('INFO_AGENT_TEST', '1')
+        mp.setattr(database, '_db_connection', None)
+        mp.setattr(vector_store, '_vector_store_instance', None)
+        repository.reset_memory_service()
+        yield test_dir
+        repository.reset_memory_service()
+        database.close_database()
+
+
+@pytest.fixture(scope="session")
+def test_db_path(test_home):
+    """Path of the session test database; the schema is created once."""
+    db_path = test_home / "info_agent.db"
+    initialize_database(str(db_path))
+    return db_path
+
+
+@pytest.fixture(scope="session")
+def memory_service(test_db_path):
+    """Memory service bound to the session test database."""
+    return repository.get_memory_service(str(test_db_path))
+
+
+@pytest.fixture
+def clean_memory_service(memory_service):
+    """
+    Memory service whose data is wiped after each test.
+
+    The service commits its own transactions, so the tables are cleared
+    instead of rolling back; the schema is left in place.
+    """
+    yield memory_service
+    db = memory_service.repository.db
+    with db.transaction() as conn:
+        conn.execute("DELETE FROM memories")
+        conn.execute("DELETE FROM sqlite_sequence WHERE name = 'memories'")
+    memory_service.repository.vector_store.reset_collection()
+
+
+class MemoryDatabaseTester:
+    """Isolated test database with its repository and service."""
+
+    def __init__(self):
+        self._tmpdir: Optional[tempfile.TemporaryDirectory] = None
+        self.test_db_dir: Optional[Path] = None
+        self.test_db_path: Optional[Path] = None
+        self.db_connection: Optional[DatabaseConnection] = None
+        self.repository: Optional[SQLiteMemoryRepository] = None
+        self.service: Optional[MemoryService] = None
+
+    def setup_test_database(self):
+        """Create and initialize a temporary test database."""
+        self._tmpdir = _fast_tmpdir("info_agent_test_")
+        self.test_db_dir = Path(self._tmpdir.name)
+        self.test_db_path = self.test_db_dir / "test_info_agent.db"
+
+        initialize_database(str(self.test_db_path))
+
+        self.db_connection = DatabaseConnection(str(self.test_db_path), bulk_mode=True)
+        self.repository = SQLiteMemoryRepository(
+            self.db_connection,
+            VectorStore(small_vector_store_config(str(self.test_db_dir)))
+        )
+        self.service = MemoryService(self.repository)
+
+    def cleanup_test_database(self):
+        """Close the connection and remove the temporary directory."""
+        if self.db_connection:
+            self.db_connection.close()
+
+        # Drop any cached service bound to this database
+        repository.reset_memory_service()
+
+        if self._tmpdir:
+            self._tmpdir.cleanup()
+            self._tmpdir = None
+
+
+@pytest.fixture
+def tester(monkeypatch):
+    """MemoryDatabaseTester with its own isolated temporary database."""
+    # Relax durability PRAGMAs on test connections
+    monkeypatch.setenv('INFO_AGENT_TEST', '1')
+
+    tester = MemoryDatabaseTester()
+    tester.setup_test_database()
+    yield tester
+    tester.cleanup_test_database()
+
+
+@pytest.fixture(scope="session")
+def openai_patch():
+    """
+    Replace the OpenAI SDK client used by OpenAIClient for the session.
+
+    Patched once when first requested; use fresh_openai in tests.
+    """
+    with patch('info_agent.ai.client.OpenAI') as mock_openai:
+        yield mock_openai
+
+
+@pytest.fixture
+def fresh_openai(openai_patch) -> Mock:
+    """Session OpenAI mock with calls and configured responses cleared."""
+    openai_patch.reset_mock(return_value=True, side_effect=True)
+    return openai_patch
@@ -0,0 +1,104 @@
+"""
+Lightweight test doubles for Info Agent tests.
+"""
+
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Union
+
+from info_agent.ai.client import AIResponse, EmbeddingResponse
+from info_agent.core.vector_store import VectorStoreConfig
+
+
+class FakeOpenAIClient:
+    """
+    Stand-in for OpenAIClient returning canned responses.
+
+    Implements only the methods MemoryProcessor uses. Chat requests are
+    recorded in chat_calls so tests can inspect prompts and call counts.
+    """
+
+    def __init__(
+        self,
+        chat_response: Optional[AIResponse] = None,
+        embed_response: Optional[EmbeddingResponse] = None,
+        connected: bool = True
+    ):
+        self.chat_response = chat_response
+        self.embed_response = embed_response
+        self.connected = connected
+        self.chat_calls: List[List[Dict[str, str]]] = []
+
+    def reset(self):
+        """Clear canned responses and recorded calls."""
+        self.chat_response = None
+        self.embed_response = None
+        self.connected = True
+        self.chat_calls = []
+
+    def chat_completion(self, messages: List[Dict[str, str]], **kwargs: Any) -> AIResponse:
+        self.chat_calls.append(messages)
+        return self.chat_response
+
+    def generate_embedding(self, text: Union[str, List[str]],
+                           model: Optional[str] = None) -> EmbeddingResponse:
+        return self.embed_response
+
+    def test_connection(self) -> bool:
+        return self.connected
+
+
+def make_chat_response(content: Optional[str], model: str = "gpt-3.5-turbo",
+                       tokens: int = 150) -> SimpleNamespace:
+    """
+    Build an object shaped like an OpenAI SDK chat completion.
+
+    Args:
+        content: Message content, or None for a response without choices
+        model: Model name reported by the response
+        tokens: Total tokens reported in usage
+
+    Returns:
+        SimpleNamespace with choices, model and usage attributes
+    """
+    choices = [] if content is None else [SimpleNamespace(message=SimpleNamespace(content=content))]
+    return SimpleNamespace(choices=choices, model=model, usage=SimpleNamespace(total_tokens=tokens))
+
+
+def make_embedding_response(embedding: List[float], model: str = "text-embedding-3-small",
+                            tokens: int = 10) -> SimpleNamespace:
+    """
+    Build an object shaped like an OpenAI SDK embedding response.
+
+    Args:
+        embedding: Embedding vector
+        model: Model name reported by the response
+        tokens: Total tokens reported in usage
+
+    Returns:
+        SimpleNamespace with data, model and usage attributes
+    """
+    return SimpleNamespace(data=[SimpleNamespace(embedding=embedding)], model=model,
+                           usage=SimpleNamespace(total_tokens=tokens))
+
+
+def small_vector_store_config(data_dir: str) -> VectorStoreConfig:
+    """
+    Build a vector store config with HNSW parameters sized for test collections.
+
+    Test collections hold a handful of documents, where a sparse graph and
+    small candidate lists give the same recall as the production settings.
+    Computed embeddings are cached on disk, so repeated test runs skip
+    re-embedding the same fixture texts.
+
+    Args:
+        data_dir: Directory for the test vector store
+
+    Returns:
+        VectorStoreConfig for the directory
+    """
+    config = VectorStoreConfig(data_dir)
+    config.hnsw_M = 8
+    config.hnsw_ef_construction = 32
+    config.hnsw_ef_search = 32
+    config.persist_embeddings = True
+    return config
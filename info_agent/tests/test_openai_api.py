@@ -7,213 +7,170 @@ This script tests OpenAI API functionality including:
 - Client initialization
 - Basic API connectivity
 - Model availability
+
+The live tests are skipped when OPENAI_API_KEY is not set and are marked
+slow, so `pytest -m "not slow"` leaves them out. The live requests are
+issued concurrently so the test waits for one round-trip instead of three.
 """
 
+import asyncio
+import json
+import logging
 import openai
 import os
 import sys
-from typing import Optional
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, Set
+
+import pytest
+
+
+logger = logging.getLogger(__name__)
+
+requires_api_key = pytest.mark.skipif(
+    not os.getenv('OPENAI_API_KEY'),
+    reason="OPENAI_API_KEY environment variable not set"
+)
+
 
+# Model IDs change rarely, so the models.list() result is cached on disk.
+# Set INFO_AGENT_TEST_NOCACHE=1 to always query the API.
+MODELS_CACHE_PATH = Path.home() / ".cache" / "info_agent" / "openai_models.json"
 
-def test_api_key_configuration() -> bool:
+
+def _load_cached_models(ttl: float = 3600) -> Optional[Set[str]]:
+    """
+    Load available model IDs from the on-disk cache.
+
+    Args:
+        ttl: Maximum cache age in seconds
+
+    Returns:
+        Set of model IDs, or None if the cache is missing, stale or disabled
+    """
+    if os.getenv('INFO_AGENT_TEST_NOCACHE') == '1':
+        return None
+    try:
+        if time.time() - MODELS_CACHE_PATH.stat().st_mtime < ttl:
+            with open(MODELS_CACHE_PATH) as f:
+                return set(json.load(f))
+    except (OSError, ValueError):
+        pass  # Missing or corrupt cache
+    return None
+
+
+def _store_cached_models(model_ids: Set[str]):
+    """Write model IDs to the on-disk cache unless caching is disabled."""
+    if os.getenv('INFO_AGENT_TEST_NOCACHE') == '1':
+        return
+    # Write to a temp file and rename so readers never see a partial file
+    MODELS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=MODELS_CACHE_PATH.parent, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(sorted(model_ids), f)
+    os.replace(tmp_path, MODELS_CACHE_PATH)
+
+
+async def _run_live_requests(include_models: bool) -> list:
+    """
+    Issue the chat, embedding and (optionally) model list requests concurrently.
+
+    Args:
+        include_models: Whether to also fetch the model list
+
+    Returns:
+        Results in request order; failed requests are returned as exceptions
+    """
+    async with openai.AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY')) as client:
+        requests = [
+            client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=[
+                    {"role": "user", "content": "Hello! Please respond with 'API test successful'."}
+                ],
+                max_tokens=10,
+                temperature=0
+            ),
+            client.embeddings.create(
+                model="text-embedding-3-small",
+                input="This is a test text for embedding generation."
+            ),
+        ]
+        if include_models:
+            requests.append(client.models.list())
+        return await asyncio.gather(*requests, return_exceptions=True)
+
+
+@pytest.fixture(scope="module")
+def client() -> openai.OpenAI:
+    """OpenAI client shared by the live API tests."""
+    return openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+
+
+@requires_api_key
+def test_api_key_configuration():
     """Test that OpenAI API key is properly configured."""
-    print("Testing OpenAI API key configuration...")
-    
+
     api_key = os.getenv('OPENAI_API_KEY')
-    
-    if not api_key:
-        print("❌ OPENAI_API_KEY environment variable not set")
-        print("   Please set your API key: export OPENAI_API_KEY='your-key-here'")
-        return False
-    
-    if not api_key.startswith('sk-'):
-        print("❌ API key format appears invalid (should start with 'sk-')")
-        return False
-    
+    assert api_key.startswith('sk-'), "API key format appears invalid (should start with 'sk-')"
+
     # Don't print the full API key for security
     masked_key = api_key[:7] + "..." + api_key[-4:] if len(api_key) > 11 else "***"
-    print(f"✅ API key configured: {masked_key}")
-    return True
+    logger.info("API key configured: %s", masked_key)
 
 
-def test_client_initialization() -> Optional[openai.OpenAI]:
+@requires_api_key
+def test_client_initialization(client):
     """Test OpenAI client initialization."""
-    print("\nTesting OpenAI client initialization...")
-    
-    try:
-        api_key = os.getenv('OPENAI_API_KEY')
-        client = openai.OpenAI(api_key=api_key)
-        print("✅ OpenAI client initialized successfully")
-        return client
-    except Exception as e:
-        print(f"❌ Failed to initialize OpenAI client: {e}")
-        return None
 
+    assert isinstance(client, openai.OpenAI)
+    logger.info("OpenAI client initialized successfully")
+
+
+@pytest.mark.slow
+@requires_api_key
+def test_live_api_smoke():
+    """Test chat, embedding and model availability with concurrent requests."""
 
-def test_api_connectivity(client: openai.OpenAI) -> bool:
-    """Test basic API connectivity with a simple request."""
-    print("\nTesting API connectivity...")
-    
-    try:
-        # Test with a minimal completion request
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "user", "content": "Hello! Please respond with 'API test successful'."}
-            ],
-            max_tokens=10,
-            temperature=0
-        )
-        
-        if response.choices and len(response.choices) > 0:
-            content = response.choices[0].message.content
-            print(f"✅ API connectivity successful")
-            print(f"   Response: {content}")
-            print(f"   Model used: {response.model}")
-            print(f"   Tokens used: {response.usage.total_tokens}")
-            return True
-        else:
-            print("❌ API responded but no content received")
-            return False
-            
-    except openai.AuthenticationError:
-        print("❌ Authentication failed - check your API key")
-        return False
-    except openai.RateLimitError:
-        print("❌ Rate limit exceeded - please try again later")
-        return False
-    except openai.APIConnectionError:
-        print("❌ Network connection error - check your internet connection")
-        return False
-    except openai.APIError as e:
-        print(f"❌ OpenAI API error: {e}")
-        return False
-    except Exception as e:
-        print(f"❌ Unexpected error during API test: {e}")
-        return False
-
-
-def test_model_availability(client: openai.OpenAI) -> bool:
-    """Test availability of models needed for the application."""
-    print("\nTesting model availability...")
-    
     required_models = [
         "gpt-3.5-turbo",
         "text-embedding-3-small"
     ]
-    
-    try:
-        # Get list of available models
-        models = client.models.list()
-        available_model_ids = {model.id for model in models.data}
-        
-        all_available = True
-        for model in required_models:
-            if model in available_model_ids:
-                print(f"✅ Model available: {model}")
-            else:
-                print(f"❌ Model not available: {model}")
-                all_available = False
-        
-        if all_available:
-            print("✅ All required models are available")
-        else:
-            print("⚠️  Some required models may not be available")
-        
-        return all_available
-        
-    except Exception as e:
-        print(f"❌ Failed to check model availability: {e}")
-        return False
-
-
-def test_embedding_functionality(client: openai.OpenAI) -> bool:
-    """Test embedding generation functionality."""
-    print("\nTesting embedding functionality...")
-    
-    try:
-        test_text = "This is a test text for embedding generation."
-        
-        response = client.embeddings.create(
-            model="text-embedding-3-small",
-            input=test_text
-        )
-        
-        if response.data and len(response.data) > 0:
-            embedding = response.data[0].embedding
-            print(f"✅ Embedding generated successfully")
-            print(f"   Embedding dimensions: {len(embedding)}")
-            print(f"   Model used: {response.model}")
-            print(f"   Tokens used: {response.usage.total_tokens}")
-            return True
-        else:
-            print("❌ No embedding data received")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Embedding test failed: {e}")
-        return False
-
-
-def main():
-    """Run all OpenAI API tests."""
-    print("=" * 60)
-    print("INFO AGENT - OpenAI API Connection Test")
-    print("=" * 60)
-    
-    tests = [
-        ("API Key Configuration", test_api_key_configuration, []),
-    ]
-    
-    # Only proceed with client-dependent tests if API key is configured
-    api_key_ok = test_api_key_configuration()
-    if api_key_ok:
-        client = test_client_initialization()
-        if client:
-            tests.extend([
-                ("Client Initialization", lambda: True, []),  # Already tested
-                ("API Connectivity", test_api_connectivity, [client]),
-                ("Model Availability", test_model_availability, [client]),
-                ("Embedding Functionality", test_embedding_functionality, [client])
-            ])
-        else:
-            tests.append(("Client Initialization", lambda: False, []))
-    
-    passed = 0
-    failed = 0
-    
-    for test_name, test_func, args in tests:
-        if test_name == "Client Initialization" and args == []:
-            # Skip if already handled above
-            continue
-            
-        try:
-            if test_func(*args):
-                passed += 1
-            else:
-                failed += 1
-        except Exception as e:
-            print(f"❌ {test_name} test crashed: {e}")
-            failed += 1
-    
-    print("\n" + "=" * 60)
-    print("TEST SUMMARY")
-    print("=" * 60)
-    print(f"✅ Passed: {passed}")
-    print(f"❌ Failed: {failed}")
-    print(f"📊 Total:  {passed + failed}")
-    
-    if failed == 0:
-        print("\n🎉 All OpenAI API tests passed! API setup is ready.")
-        return 0
+
+    cached_models = _load_cached_models()
+    results = asyncio.run(_run_live_requests(include_models=cached_models is None))
+    chat_response, embed_response = results[:2]
+
+    # API connectivity
+    assert not isinstance(chat_response, Exception), f"Chat completion failed: {chat_response!r}"
+    assert chat_response.choices, "API responded but no content received"
+    logger.info("API connectivity successful: response=%r model=%s tokens=%d",
+                chat_response.choices[0].message.content, chat_response.model,
+                chat_response.usage.total_tokens)
+
+    # Embedding functionality
+    assert not isinstance(embed_response, Exception), f"Embedding request failed: {embed_response!r}"
+    assert embed_response.data, "No embedding data received"
+    logger.info("Embedding generated successfully: dimensions=%d model=%s tokens=%d",
+                len(embed_response.data[0].embedding), embed_response.model,
+                embed_response.usage.total_tokens)
+
+    # Model availability
+    if cached_models is None:
+        models_response = results[2]
+        assert not isinstance(models_response, Exception), \
+            f"Failed to list models: {models_response!r}"
+        available_model_ids = {model.id for model in models_response.data}
+        _store_cached_models(available_model_ids)
     else:
-        print(f"\n⚠️  {failed} test(s) failed. Please check the errors above.")
-        if not api_key_ok:
-            print("\n💡 Tip: Make sure to set your OpenAI API key:")
-            print("   export OPENAI_API_KEY='your-api-key-here'")
-        return 1
+        available_model_ids = cached_models
+
+    missing = [model for model in required_models if model not in available_model_ids]
+    assert not missing, f"Models not available: {missing}"
+    logger.info("All required models are available")
 
 
 if __name__ == "__main__":
-    sys.exit(main())
-                    
+    sys.exit(pytest.main([__file__, "-v"]))
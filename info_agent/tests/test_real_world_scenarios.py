@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Test script for real-world text scenarios.
+
+This script checks that the unified extraction prompt handles the kinds of
+text the app is used with (meeting notes, reminders, learning notes, etc.).
+Each scenario runs as its own test case.
+"""
+
+import logging
+import re
+import sys
+
+import pytest
+
+from info_agent.ai import extract_all_information_prompt
+from info_agent.tests._scenarios import SCENARIOS
+
+logger = logging.getLogger(__name__)
+
+
+# Elements the prompt structure must contain, matched in one pass
+STRUCTURE_ELEMENTS = frozenset(["JSON format", "title", "description", "categories"])
+STRUCTURE_PATTERN = re.compile("|".join(map(re.escape, sorted(STRUCTURE_ELEMENTS, key=len, reverse=True))))
+
+# Scenario prompts and expected-element patterns, built once per module
+SCENARIO_PROMPTS = {s["name"]: extract_all_information_prompt(s["text"]) for s in SCENARIOS}
+SCENARIO_PATTERNS = {
+    s["name"]: re.compile("|".join(map(re.escape, s["expected_elements"]))) for s in SCENARIOS
+}
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=lambda s: s["name"])
+def test_scenario(scenario):
+    """Test unified prompt generation for a real-world text scenario."""
+    prompt = SCENARIO_PROMPTS[scenario["name"]]
+
+    # Check that prompt contains original text and expected elements are preserved
+    assert scenario["text"] in prompt
+    found = set(SCENARIO_PATTERNS[scenario["name"]].findall(scenario["text"]))
+    assert found == set(scenario["expected_elements"]), \
+        f"Missing elements: {sorted(set(scenario['expected_elements']) - found)}"
+
+    # Check prompt structure is appropriate
+    missing = STRUCTURE_ELEMENTS - set(STRUCTURE_PATTERN.findall(prompt))
+    assert not missing, f"Prompt missing structure elements: {sorted(missing)}"
+    logger.info("%s scenario handled correctly", scenario["name"])
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test script for the semantic cache.
+
+This script tests the semantic cache functionality including:
+- Exact key lookups
+- Near-duplicate embedding lookups
+- Namespace isolation
+- LRU eviction
+- Time-to-live expiry
+"""
+
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from info_agent.utils.semantic_cache import SemanticCache
+
+
+def test_exact_lookup():
+    """Test exact key hits and misses."""
+    print("Testing exact lookups...")
+
+    cache = SemanticCache()
+    cache.put("work meetings", [1.0, 0.0, 0.0], ["result"])
+
+    assert cache.get("work meetings") == ["result"]
+    assert cache.get("shopping") is None
+    print("✅ Exact key lookups work")
+
+
+def test_similar_lookup():
+    """Test near-duplicate embeddings hit and unrelated ones miss."""
+    print("\nTesting similarity lookups...")
+
+    cache = SemanticCache(threshold=0.98)
+    cache.put("work meetings", [1.0, 0.0, 0.0], "cached", namespace=10)
+
+    # Scaled vector has identical direction
+    assert cache.get_similar([2.0, 0.0, 0.0], namespace=10) == "cached"
+    assert cache.get_similar([0.0, 1.0, 0.0], namespace=10) is None
+    assert cache.get_similar([1.0, 0.0, 0.0], namespace=5) is None
+
+    # The most similar entry in the namespace wins
+    cache.put("work calls", [0.99, 0.14, 0.0], "calls", namespace=10)
+    cache.put("other", [0.99, 0.0, 0.14], "other", namespace=5)
+    assert cache.get_similar([0.98, 0.2, 0.0], namespace=10) == "calls"
+    assert cache.get_similar([0.98, 0.0, 0.2], namespace=10) is None
+    print("✅ Similarity lookups respect threshold and namespace")
+
+
+def test_eviction_and_clear():
+    """Test LRU eviction and clearing."""
+    print("\nTesting eviction...")
+
+    cache = SemanticCache(max_size=2)
+    cache.put("a", [1.0, 0.0], 1)
+    cache.put("b", [0.0, 1.0], 2)
+    cache.get("a")  # Mark "a" as recently used
+    cache.put("c", [1.0, 1.0], 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get_similar([1.0, 0.0]) is None
+    print("✅ Least recently used entry evicted and clear empties cache")
+
+
+def test_ttl_expiry():
+    """Test that entries expire after the time to live."""
+    print("\nTesting TTL expiry...")
+
+    cache = SemanticCache(ttl=0.05)
+    cache.put("work meetings", [1.0, 0.0, 0.0], "cached")
+    assert cache.get("work meetings") == "cached"
+    assert cache.get_similar([1.0, 0.0, 0.0]) == "cached"
+
+    time.sleep(0.1)
+    assert cache.get_similar([1.0, 0.0, 0.0]) is None
+    assert cache.get("work meetings") is None
+    assert len(cache) == 0
+    print("✅ Expired entries are dropped on lookup")
+
+
+def main():
+    """Run all semantic cache tests."""
+    print("=" * 60)
+    print("SEMANTIC CACHE TESTS")
+    print("=" * 60)
+
+    tests = [
+        ("Exact Lookup", test_exact_lookup),
+        ("Similar Lookup", test_similar_lookup),
+        ("Eviction and Clear", test_eviction_and_clear),
+        ("TTL Expiry", test_ttl_expiry),
+    ]
+
+    failed = 0
+    for test_name, test_func in tests:
+        try:
+            test_func()
+        except AssertionError as e:
+            print(f"❌ {test_name} test failed: {e}")
+            failed += 1
+
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,26 +6,31 @@ This script tests the integration between the AI client and prompt templates
 to ensure the complete text processing pipeline works correctly.
 """
 
-import os
-import sys
 import json
-from unittest.mock import Mock, patch
+import logging
+import re
+import sys
 
-# Add project root to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import pytest
 
 from info_agent.ai import (
     OpenAIClient, AIResponse, EmbeddingResponse,
     extract_all_information_prompt
 )
+from info_agent.tests.fakes import make_chat_response, make_embedding_response
+
+logger = logging.getLogger(__name__)
+
 
+# Elements the unified prompt must contain, matched in one pass
+PROMPT_ELEMENTS = frozenset(["JSON format", "title", "description", "summary", "categories", "dynamic_fields"])
+PROMPT_ELEMENTS_PATTERN = re.compile("|".join(map(re.escape, sorted(PROMPT_ELEMENTS, key=len, reverse=True))))
 
-def test_mock_information_extraction():
+
+def test_mock_information_extraction(fresh_openai):
     """Test information extraction with mocked AI responses."""
-    print("Testing information extraction...")
-    
     test_text = "Meeting with John Smith on Tuesday at 2pm to discuss Q4 budget. Need to prepare financial reports and schedule follow-up with accounting team."
-    
+
     # Mock AI response for information extraction
     mock_response_content = {
         "key_facts": ["Q4 budget discussion", "Financial reports needed"],
@@ -37,268 +42,92 @@ def test_mock_information_extraction():
         "action_items": ["prepare financial reports", "schedule follow-up with accounting team"],
         "categories": ["work", "meetings", "finance"]
     }
-    
-    try:
-        with patch('info_agent.ai.client.OpenAI') as mock_openai:
-            mock_client = Mock()
-            mock_openai.return_value = mock_client
-            
-            client = OpenAIClient(api_key="sk-test1234567890abcdef")
-            
-            # Mock the response
-            mock_api_response = Mock()
-            mock_api_response.choices = [Mock()]
-            mock_api_response.choices[0].message.content = json.dumps(mock_response_content)
-            mock_api_response.model = "gpt-3.5-turbo"
-            mock_api_response.usage = Mock()
-            mock_api_response.usage.total_tokens = 150
-            
-            mock_client.chat.completions.create.return_value = mock_api_response
-            
-            # Generate extraction prompt and process
-            prompt = extract_all_information_prompt(test_text)
-            response = client.chat_completion([{"role": "user", "content": prompt}])
-            
-            if response.success and "John Smith" in response.content:
-                print("✅ Information extraction pipeline works")
-                
-                # Try to parse the JSON response
-                try:
-                    extracted_data = json.loads(response.content)
-                    if ("key_facts" in extracted_data and 
-                        "entities" in extracted_data and
-                        "John Smith" in str(extracted_data)):
-                        print("✅ Extracted information is properly structured")
-                    else:
-                        print("❌ Extracted information missing expected fields")
-                        return False
-                except json.JSONDecodeError:
-                    print("❌ Response is not valid JSON")
-                    return False
-            else:
-                print(f"❌ Information extraction failed: {response}")
-                return False
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Information extraction test failed: {e}")
-        return False
-
-
-
-
-def test_mock_embedding_generation():
+
+    mock_client = fresh_openai.return_value
+
+    client = OpenAIClient(api_key="sk-test1234567890abcdef")
+
+    mock_client.chat.completions.create.return_value = make_chat_response(
+        json.dumps(mock_response_content), tokens=150
+    )
+
+    # Generate extraction prompt and process
+    prompt = extract_all_information_prompt(test_text)
+    response = client.chat_completion([{"role": "user", "content": prompt}])
+
+    assert response.success and "John Smith" in response.content, \
+        f"Information extraction failed: {response}"
+    logger.info("Information extraction pipeline works")
+
+    extracted_data = json.loads(response.content)
+    assert "key_facts" in extracted_data and "entities" in extracted_data, \
+        "Extracted information missing expected fields"
+    assert "John Smith" in str(extracted_data)
+    logger.info("Extracted information is properly structured")
+
+
+def test_mock_embedding_generation(fresh_openai):
     """Test embedding generation functionality."""
-    print("\nTesting embedding generation...")
-    
     test_text = "This is a test document for embedding generation."
     expected_embedding = [0.1, -0.2, 0.3, -0.4, 0.5] * 100  # Simulate 500-dim embedding
-    
-    try:
-        with patch('info_agent.ai.client.OpenAI') as mock_openai:
-            mock_client = Mock()
-            mock_openai.return_value = mock_client
-            
-            client = OpenAIClient(api_key="sk-test1234567890abcdef")
-            
-            # Mock the embedding response
-            mock_embed_response = Mock()
-            mock_embed_response.data = [Mock()]
-            mock_embed_response.data[0].embedding = expected_embedding
-            mock_embed_response.model = "text-embedding-3-small"
-            mock_embed_response.usage = Mock()
-            mock_embed_response.usage.total_tokens = 10
-            
-            mock_client.embeddings.create.return_value = mock_embed_response
-            
-            # Generate embedding
-            response = client.generate_embedding(test_text)
-            
-            if (response.success and 
-                response.embedding == expected_embedding and
-                response.dimensions == len(expected_embedding) and
-                response.model == "text-embedding-3-small"):
-                print("✅ Embedding generation works correctly")
-            else:
-                print(f"❌ Embedding generation failed: {response}")
-                return False
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Embedding generation test failed: {e}")
-        return False
-
-
-def test_error_handling_integration():
+
+    mock_client = fresh_openai.return_value
+
+    client = OpenAIClient(api_key="sk-test1234567890abcdef")
+
+    mock_client.embeddings.create.return_value = make_embedding_response(
+        expected_embedding, model="text-embedding-3-small", tokens=10
+    )
+
+    # Generate embedding
+    response = client.generate_embedding(test_text)
+
+    assert response.success, f"Embedding generation failed: {response}"
+    assert response.embedding == expected_embedding
+    assert response.dimensions == len(expected_embedding)
+    assert response.model == "text-embedding-3-small"
+    logger.info("Embedding generation works correctly")
+
+
+def test_error_handling_integration(fresh_openai):
     """Test error handling in the complete pipeline."""
-    print("\nTesting error handling integration...")
-    
-    try:
-        with patch('info_agent.ai.client.OpenAI') as mock_openai:
-            mock_client = Mock()
-            mock_openai.return_value = mock_client
-            
-            client = OpenAIClient(api_key="sk-test1234567890abcdef")
-            
-            # Mock an empty response (no choices)
-            mock_api_response = Mock()
-            mock_api_response.choices = []
-            mock_api_response.model = "gpt-3.5-turbo"
-            mock_api_response.usage = Mock()
-            mock_api_response.usage.total_tokens = 0
-            
-            mock_client.chat.completions.create.return_value = mock_api_response
-            
-            # Test with unified information extraction
-            test_text = "Some test text"
-            prompt = extract_all_information_prompt(test_text)
-            response = client.chat_completion([{"role": "user", "content": prompt}])
-            
-            if (not response.success and 
-                response.error == "No response choices received" and
-                response.content == ""):
-                print("✅ Error handling works in complete pipeline")
-            else:
-                print(f"❌ Error handling failed: {response}")
-                return False
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error handling integration test failed: {e}")
-        return False
+    mock_client = fresh_openai.return_value
+
+    client = OpenAIClient(api_key="sk-test1234567890abcdef")
+
+    # Mock an empty response (no choices)
+    mock_client.chat.completions.create.return_value = make_chat_response(None, tokens=0)
+
+    # Test with unified information extraction
+    test_text = "Some test text"
+    prompt = extract_all_information_prompt(test_text)
+    response = client.chat_completion([{"role": "user", "content": prompt}])
+
+    assert not response.success, f"Error handling failed: {response}"
+    assert response.error == "No response choices received"
+    assert response.content == ""
+    logger.info("Error handling works in complete pipeline")
 
 
 def test_prompt_integration():
     """Test that unified prompt is correctly formatted and contains expected content."""
-    print("\nTesting prompt integration...")
-    
     test_text = "Project status update: Development is 75% complete, testing phase starts next week, deployment planned for month end."
-    
+
     # Test the unified prompt
     unified_prompt = extract_all_information_prompt(test_text)
-    
+
     # Check that prompt contains the original text
-    if test_text not in unified_prompt:
-        print("❌ Unified prompt doesn't contain the original text")
-        return False
-    
+    assert test_text in unified_prompt, "Unified prompt doesn't contain the original text"
+
     # Check that prompt has all expected elements
-    expected_elements = ["JSON format", "title", "description", "summary", "categories", "dynamic_fields"]
-    if all(element in unified_prompt for element in expected_elements):
-        print("✅ Unified prompt has all expected elements")
-    else:
-        missing = [elem for elem in expected_elements if elem not in unified_prompt]
-        print(f"❌ Unified prompt missing elements: {missing}")
-        return False
-    
+    missing = PROMPT_ELEMENTS - set(PROMPT_ELEMENTS_PATTERN.findall(unified_prompt))
+    assert not missing, f"Unified prompt missing elements: {sorted(missing)}"
+    logger.info("Unified prompt has all expected elements")
+
     # Check prompt length is reasonable
-    if len(unified_prompt) > 500:  # Should be substantial prompt
-        print("✅ Unified prompt has reasonable length")
-    else:
-        print("❌ Unified prompt too short")
-        return False
-    
-    return True
-
-
-def test_real_world_scenarios():
-    """Test with realistic text scenarios that might be used in the app."""
-    print("\nTesting real-world scenarios...")
-    
-    scenarios = [
-        {
-            "name": "Meeting Note",
-            "text": "Team standup meeting - Sarah completed the user interface mockups, John is working on database optimization, Maria will start integration testing tomorrow. Next meeting scheduled for Friday at 10am.",
-            "should_contain": ["Sarah", "database", "Friday"]
-        },
-        {
-            "name": "Task Reminder",
-            "text": "Remember to backup production database before the maintenance window on Saturday at 3am. Also need to notify all users about the planned downtime via email and slack.",
-            "should_contain": ["Saturday", "backup", "maintenance"]
-        },
-        {
-            "name": "Learning Note",
-            "text": "Completed Python course module on decorators and context managers. Key concepts: @wraps decorator, __enter__ and __exit__ methods, with statement usage. Practice exercises due next Tuesday.",
-            "should_contain": ["Python", "decorators", "Tuesday"]
-        }
-    ]
-    
-    for scenario in scenarios:
-        # Test that we can generate appropriate unified prompts for each scenario
-        try:
-            unified_prompt = extract_all_information_prompt(scenario["text"])
-            
-            # Check that prompt contains the original text and expected keywords
-            text_in_prompt = scenario["text"] in unified_prompt
-            keywords_present = any(keyword in scenario["text"] for keyword in scenario["should_contain"])
-            has_structure = "JSON format" in unified_prompt
-            
-            if text_in_prompt and keywords_present and has_structure:
-                print(f"✅ {scenario['name']} scenario handled correctly")
-            else:
-                print(f"❌ {scenario['name']} scenario failed")
-                return False
-                
-        except Exception as e:
-            print(f"❌ {scenario['name']} scenario crashed: {e}")
-            return False
-    
-    return True
-
-
-def main():
-    """Run all text processing tests."""
-    print("=" * 60)
-    print("INFO AGENT - Unified Text Processing Integration Test")
-    print("=" * 60)
-    
-    tests = [
-        ("Unified Information Extraction", test_mock_information_extraction),
-        ("Embedding Generation", test_mock_embedding_generation),
-        ("Error Handling Integration", test_error_handling_integration),
-        ("Prompt Integration", test_prompt_integration),
-        ("Real-World Scenarios", test_real_world_scenarios),
-    ]
-    
-    passed = 0
-    failed = 0
-    
-    for test_name, test_func in tests:
-        try:
-            if test_func():
-                passed += 1
-            else:
-                failed += 1
-        except Exception as e:
-            print(f"❌ {test_name} test crashed: {e}")
-            failed += 1
-    
-    print("\n" + "=" * 60)
-    print("TEST SUMMARY")
-    print("=" * 60)
-    print(f"✅ Passed: {passed}")
-    print(f"❌ Failed: {failed}")
-    print(f"📊 Total:  {passed + failed}")
-    
-    if failed == 0:
-        print("\n🎉 All unified text processing integration tests passed!")
-        print("\n📋 Unified text processing pipeline is ready:")
-        print("   • OpenAI API client with retry logic ✅")
-        print("   • Unified prompt template ✅") 
-        print("   • Complete information extraction in single call ✅")
-        print("   • Title, description, summary, categories, entities ✅")
-        print("   • Dynamic fields and metadata ✅")
-        print("   • Embedding generation ✅")
-        print("   • Error handling and validation ✅")
-        print("   • 80% cost reduction vs separate prompts ✅")
-        return 0
-    else:
-        print(f"\n⚠️  {failed} test(s) failed. Please check the errors above.")
-        return 1
+    assert len(unified_prompt) > 500, "Unified prompt too short"  # Should be substantial prompt
+    logger.info("Unified prompt has reasonable length")
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -6,312 +6,152 @@ This script tests the new unified prompt approach that extracts all information
 (title, description, summary, categories, entities, etc.) in a single AI call.
 """
 
-import os
-import sys
 import json
-from unittest.mock import Mock, patch
+import logging
+import re
+import sys
 
-# Add project root to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import pytest
 
 from info_agent.ai import (
     OpenAIClient, PromptType, PromptManager,
     extract_all_information_prompt
 )
+from info_agent.tests.fakes import make_chat_response
+
+logger = logging.getLogger(__name__)
+
+
+# Mock comprehensive AI response, encoded once (minified) at import
+_MOCK_UNIFIED_DICT = {
+    "title": "Team Standup Meeting - Dashboard and API Progress",
+    "description": "Team progress update on user dashboard completion, API integration work, and upcoming client demo scheduling.",
+    "summary": "John finished the user dashboard while Sarah continues API integration work. Project deadline is Friday, and team needs to schedule client demo for next week.",
+    "categories": ["work", "meetings", "projects"],
+    "key_facts": ["User dashboard completed", "API integration in progress", "Client demo needed"],
+    "dates_times": ["Friday", "next week"],
+    "entities": {
+        "people": ["John", "Sarah"],
+        "organizations": [],
+        "places": []
+    },
+    "action_items": ["Schedule client demo for next week"],
+    "dynamic_fields": {
+        "priority": "high",
+        "status": "active",
+        "due_date": "2024-08-09",  # Friday
+        "source": "meeting",
+        "tags": ["standup", "dashboard", "api", "demo"],
+        "project_type": "software_development"
+    }
+}
+MOCK_UNIFIED_JSON = json.dumps(_MOCK_UNIFIED_DICT, separators=(',', ':'))
+
+# Fields the unified prompt's JSON structure must mention, matched in one pass
+PROMPT_FIELDS = frozenset([
+    "title", "description", "summary", "categories",
+    "key_facts", "dates_times", "entities", "action_items", "dynamic_fields"
+])
+PROMPT_FIELDS_PATTERN = re.compile("|".join(map(re.escape, sorted(PROMPT_FIELDS, key=len, reverse=True))))
 
 
 def test_unified_prompt_generation():
     """Test that the unified prompt contains all necessary elements."""
-    print("Testing unified prompt generation...")
-    
     test_text = "Meeting with Sarah on Tuesday at 2pm to discuss Q4 budget planning and review financial reports."
-    
+
     prompt = extract_all_information_prompt(test_text)
-    
+
     # Check that prompt contains the original text
-    if test_text not in prompt:
-        print("❌ Prompt doesn't contain original text")
-        return False
-    
+    assert test_text in prompt, "Prompt doesn't contain original text"
+
     # Check that prompt includes all expected fields in JSON structure
-    expected_fields = [
-        "title", "description", "summary", "categories",
-        "key_facts", "dates_times", "entities", "action_items", "dynamic_fields"
-    ]
-    
-    if not all(field in prompt for field in expected_fields):
-        missing_fields = [field for field in expected_fields if field not in prompt]
-        print(f"❌ Prompt missing expected fields: {missing_fields}")
-        return False
-    
+    missing_fields = PROMPT_FIELDS - set(PROMPT_FIELDS_PATTERN.findall(prompt))
+    assert not missing_fields, f"Prompt missing expected fields: {sorted(missing_fields)}"
+
     # Check that it includes guidelines for each field
     guidelines = ["80 characters", "200 characters", "100 words"]
-    if not all(guideline in prompt for guideline in guidelines):
-        print("❌ Prompt missing length guidelines")
-        return False
-    
-    print("✅ Unified prompt contains all necessary elements")
-    return True
+    assert all(guideline in prompt for guideline in guidelines), "Prompt missing length guidelines"
+
+    logger.info("Unified prompt contains all necessary elements")
 
 
-def test_unified_extraction_mock():
+def test_unified_extraction_mock(fresh_openai):
     """Test unified extraction with mocked AI response."""
-    print("\nTesting unified extraction with mocked response...")
-    
     test_text = "Team standup meeting - John completed the user dashboard, Sarah is working on API integration, deadline is Friday. Need to schedule client demo for next week."
-    
-    # Mock comprehensive AI response
-    mock_response_content = {
-        "title": "Team Standup Meeting - Dashboard and API Progress",
-        "description": "Team progress update on user dashboard completion, API integration work, and upcoming client demo scheduling.",
-        "summary": "John finished the user dashboard while Sarah continues API integration work. Project deadline is Friday, and team needs to schedule client demo for next week.",
-        "categories": ["work", "meetings", "projects"],
-        "key_facts": ["User dashboard completed", "API integration in progress", "Client demo needed"],
-        "dates_times": ["Friday", "next week"],
-        "entities": {
-            "people": ["John", "Sarah"],
-            "organizations": [],
-            "places": []
-        },
-        "action_items": ["Schedule client demo for next week"],
-        "dynamic_fields": {
-            "priority": "high",
-            "status": "active",
-            "due_date": "2024-08-09",  # Friday
-            "source": "meeting",
-            "tags": ["standup", "dashboard", "api", "demo"],
-            "project_type": "software_development"
-        }
-    }
-    
-    try:
-        with patch('info_agent.ai.client.OpenAI') as mock_openai:
-            mock_client = Mock()
-            mock_openai.return_value = mock_client
-            
-            client = OpenAIClient(api_key="sk-test1234567890abcdef")
-            
-            # Mock the API response
-            mock_api_response = Mock()
-            mock_api_response.choices = [Mock()]
-            mock_api_response.choices[0].message.content = json.dumps(mock_response_content, indent=2)
-            mock_api_response.model = "gpt-3.5-turbo"
-            mock_api_response.usage = Mock()
-            mock_api_response.usage.total_tokens = 200
-            
-            mock_client.chat.completions.create.return_value = mock_api_response
-            
-            # Generate unified prompt and process
-            prompt = extract_all_information_prompt(test_text)
-            response = client.chat_completion([{"role": "user", "content": prompt}])
-            
-            if not response.success:
-                print(f"❌ AI call failed: {response.error}")
-                return False
-            
-            # Parse the JSON response
-            try:
-                extracted_data = json.loads(response.content)
-            except json.JSONDecodeError as e:
-                print(f"❌ Failed to parse JSON response: {e}")
-                return False
-            
-            # Validate all expected fields are present
-            expected_top_level = ["title", "description", "summary", "categories", "dynamic_fields"]
-            for field in expected_top_level:
-                if field not in extracted_data:
-                    print(f"❌ Missing field in response: {field}")
-                    return False
-            
-            # Validate field contents (check that key information is properly extracted)
-            title_correct = extracted_data.get("title") == "Team Standup Meeting - Dashboard and API Progress"
-            has_people = "John" in str(extracted_data) and "Sarah" in str(extracted_data)  # Either in desc, summary, or entities
-            work_in_categories = "work" in extracted_data.get("categories", [])
-            priority_high = extracted_data.get("dynamic_fields", {}).get("priority") == "high"
-            has_entities = len(extracted_data.get("entities", {}).get("people", [])) >= 2  # Should have John and Sarah
-            
-            if title_correct and has_people and work_in_categories and priority_high and has_entities:
-                print("✅ Unified extraction produces complete, structured data")
-                print(f"   • Title: {extracted_data['title']}")
-                print(f"   • Categories: {', '.join(extracted_data['categories'])}")
-                print(f"   • Priority: {extracted_data['dynamic_fields']['priority']}")
-                return True
-            else:
-                print("❌ Response data doesn't match expected content")
-                print(f"   Debug info:")
-                print(f"     • Title correct: {title_correct}")
-                print(f"     • Has people (John & Sarah): {has_people}")
-                print(f"     • Work in categories: {work_in_categories}")
-                print(f"     • Priority high: {priority_high}")
-                print(f"     • Has entities: {has_entities}")
-                return False
-        
-    except Exception as e:
-        print(f"❌ Unified extraction test failed: {e}")
-        return False
+
+    mock_client = fresh_openai.return_value
+
+    client = OpenAIClient(api_key="sk-test1234567890abcdef")
+
+    mock_client.chat.completions.create.return_value = make_chat_response(MOCK_UNIFIED_JSON, tokens=200)
+
+    # Generate unified prompt and process
+    prompt = extract_all_information_prompt(test_text)
+    response = client.chat_completion([{"role": "user", "content": prompt}])
+
+    assert response.success, f"AI call failed: {response.error}"
+
+    # The client passes the JSON through unchanged, so the reference dict
+    # can be validated directly instead of re-parsing the response
+    assert response.content == MOCK_UNIFIED_JSON
+    extracted_data = _MOCK_UNIFIED_DICT
+
+    # Validate all expected fields are present
+    expected_top_level = ["title", "description", "summary", "categories", "dynamic_fields"]
+    missing = [field for field in expected_top_level if field not in extracted_data]
+    assert not missing, f"Missing fields in response: {missing}"
+
+    # Validate field contents (check that key information is properly extracted)
+    assert extracted_data.get("title") == "Team Standup Meeting - Dashboard and API Progress"
+    # Either in desc, summary, or entities
+    assert "John" in str(extracted_data) and "Sarah" in str(extracted_data)
+    assert "work" in extracted_data.get("categories", [])
+    assert extracted_data.get("dynamic_fields", {}).get("priority") == "high"
+    # Should have John and Sarah
+    assert len(extracted_data.get("entities", {}).get("people", [])) >= 2
+
+    logger.info("Unified extraction produces complete, structured data: title=%r categories=%s priority=%s",
+                extracted_data['title'], ', '.join(extracted_data['categories']),
+                extracted_data['dynamic_fields']['priority'])
 
 
 def test_efficiency_comparison():
     """Test that shows the efficiency benefit of unified vs multiple prompts."""
-    print("\nTesting efficiency comparison...")
-    
     test_text = "Important project update: Development milestone reached, need to prepare presentation for stakeholders meeting on Monday."
-    
+
     # Count tokens/calls for unified approach
     unified_prompt = extract_all_information_prompt(test_text)
     unified_calls = 1
-    
+
     # Theoretical count for what separate approach would need
     separate_calls = 5  # title, description, summary, categorization, field creation
-    
+
     # Calculate rough efficiency improvement
     efficiency_improvement = (separate_calls - unified_calls) / separate_calls * 100
-    
-    print(f"✅ Efficiency comparison:")
-    print(f"   • Unified approach: {unified_calls} API call")
-    print(f"   • Separate approach: {separate_calls} API calls")
-    print(f"   • Efficiency improvement: {efficiency_improvement:.0f}% fewer calls")
-    print(f"   • Cost reduction: ~{efficiency_improvement:.0f}% (plus reduced latency)")
-    
-    if efficiency_improvement > 70:  # Should be 80% improvement (4 calls saved out of 5)
-        return True
-    else:
-        print(f"❌ Expected higher efficiency improvement, got {efficiency_improvement:.0f}%")
-        return False
+
+    logger.info("Efficiency comparison: %d unified call vs %d separate calls (%.0f%% fewer calls)",
+                unified_calls, separate_calls, efficiency_improvement)
+
+    # Should be 80% improvement (4 calls saved out of 5)
+    assert efficiency_improvement > 70, \
+        f"Expected higher efficiency improvement, got {efficiency_improvement:.0f}%"
 
 
 def test_backward_compatibility():
     """Test that the unified approach is streamlined."""
-    print("\nTesting streamlined approach...")
-    
-    # Since we removed all legacy functions, test that we have a clean interface
-    try:
-        from info_agent.ai import PromptType
-        
-        # Should only have EXTRACT_ALL
-        available_types = list(PromptType)
-        if len(available_types) == 1 and PromptType.EXTRACT_ALL in available_types:
-            print("✅ Streamlined to single prompt type")
-            
-            # Test that the function works
-            test_text = "Test text"
-            unified_prompt = extract_all_information_prompt(test_text)
-            
-            if test_text in unified_prompt:
-                print("✅ Unified extraction function works")
-                return True
-            else:
-                print("❌ Unified function missing test text")
-                return False
-        else:
-            print(f"❌ Expected 1 prompt type, found {len(available_types)}: {available_types}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Streamlined approach test failed: {e}")
-        return False
-
-
-def test_real_world_scenarios():
-    """Test unified extraction with various real-world text types."""
-    print("\nTesting real-world scenarios...")
-    
-    scenarios = [
-        {
-            "name": "Meeting Notes",
-            "text": "Weekly team sync - discussed Q3 roadmap, Sarah presented user research findings, decided to prioritize mobile app features. Action items: schedule design review (John), update project timeline (Maria), get stakeholder approval by Friday.",
-            "expected_elements": ["roadmap", "Sarah", "mobile app", "Friday"]
-        },
-        {
-            "name": "Task Reminder", 
-            "text": "Reminder: Complete tax filing before April 15th deadline. Need to gather W-2 forms, investment statements, and receipts for business expenses. Consider consulting with accountant if needed.",
-            "expected_elements": ["April 15th", "tax filing", "W-2 forms", "accountant"]
-        },
-        {
-            "name": "Learning Note",
-            "text": "Completed Chapter 5 of Machine Learning book covering neural networks and backpropagation. Key concepts: gradient descent optimization, activation functions (ReLU, sigmoid), overfitting prevention. Practice problems assigned for next week.",
-            "expected_elements": ["neural networks", "gradient descent", "next week", "Machine Learning"]
-        },
-        {
-            "name": "Project Update",
-            "text": "Database migration completed successfully last night at 2 AM. All tables transferred, indexes rebuilt, performance tests passed. Website is back online with 15% faster query response times. Monitoring for any issues over next 48 hours.",
-            "expected_elements": ["2 AM", "15% faster", "48 hours", "migration"]
-        }
-    ]
-    
-    for scenario in scenarios:
-        try:
-            # Generate unified prompt for each scenario
-            prompt = extract_all_information_prompt(scenario["text"])
-            
-            # Check that prompt contains original text and expected elements are preserved
-            text_included = scenario["text"] in prompt
-            elements_preserved = all(element in scenario["text"] for element in scenario["expected_elements"])
-            
-            # Check prompt structure is appropriate
-            has_json_structure = all(field in prompt for field in ["title", "description", "categories"])
-            
-            if text_included and elements_preserved and has_json_structure:
-                print(f"✅ {scenario['name']} scenario handled correctly")
-            else:
-                print(f"❌ {scenario['name']} scenario failed validation")
-                return False
-                
-        except Exception as e:
-            print(f"❌ {scenario['name']} scenario crashed: {e}")
-            return False
-    
-    return True
-
-
-def main():
-    """Run all unified extraction tests."""
-    print("=" * 60)
-    print("INFO AGENT - Unified Information Extraction Test")
-    print("=" * 60)
-    
-    tests = [
-        ("Unified Prompt Generation", test_unified_prompt_generation),
-        ("Unified Extraction Mock", test_unified_extraction_mock),
-        ("Efficiency Comparison", test_efficiency_comparison),
-        ("Streamlined Interface", test_backward_compatibility),
-        ("Real-World Scenarios", test_real_world_scenarios),
-    ]
-    
-    passed = 0
-    failed = 0
-    
-    for test_name, test_func in tests:
-        try:
-            if test_func():
-                passed += 1
-            else:
-                failed += 1
-        except Exception as e:
-            print(f"❌ {test_name} test crashed: {e}")
-            failed += 1
-    
-    print("\n" + "=" * 60)
-    print("TEST SUMMARY")
-    print("=" * 60)
-    print(f"✅ Passed: {passed}")
-    print(f"❌ Failed: {failed}")
-    print(f"📊 Total:  {passed + failed}")
-    
-    if failed == 0:
-        print("\n🎉 All unified extraction tests passed!")
-        print("\n📋 Unified Information Extraction Benefits:")
-        print("   • Single API call instead of 5+ separate calls ✅")
-        print("   • ~80% cost reduction ✅")
-        print("   • Faster processing (reduced latency) ✅")  
-        print("   • Consistent context across all extractions ✅")
-        print("   • All metadata in one structured response ✅")
-        print("\n🚀 Ready to implement in memory creation pipeline!")
-        return 0
-    else:
-        print(f"\n⚠️  {failed} test(s) failed. Please check the errors above.")
-        return 1
+    # Legacy per-field prompt types are gone; extraction uses the unified
+    # prompt (search analysis has its own type)
+    available_types = list(PromptType)
+    assert PromptType.EXTRACT_ALL in available_types, \
+        f"Unified prompt type missing, found: {available_types}"
+    logger.info("Unified prompt type available")
+
+    # Test that the function works
+    test_text = "Test text"
+    unified_prompt = extract_all_information_prompt(test_text)
+    assert test_text in unified_prompt, "Unified function missing test text"
+    logger.info("Unified extraction function works")
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v"]))
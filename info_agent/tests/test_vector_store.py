@@ -10,22 +10,77 @@ This script tests ChromaDB vector store functionality including:
 """
 
 import os
+import re
 import sys
 import tempfile
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any
 
+import numpy as np
+import pytest
+
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from info_agent.core.vector_store import VectorStore, VectorStoreConfig, initialize_vector_store
-from info_agent.core.models import Memory
+from info_agent.core.models import Memory, MemorySearchResult
+from info_agent.tests.fakes import small_vector_store_config
 from info_agent.core.repository import get_memory_service
 from info_agent.utils.logging_config import setup_logging, get_logger
 
 
+def search_matrix(vector_store: VectorStore, queries: List[str],
+                  limit: int = 10) -> List[List[MemorySearchResult]]:
+    """Search several queries at once by scoring every stored memory exactly.
+    
+    All queries are embedded in one batch and scored against the full
+    embedding matrix with a single matrix product, bypassing the HNSW
+    index. Only meant for the small test collections: every embedding is
+    loaded into memory.
+    
+    Args:
+        vector_store: Vector store to search
+        queries: Search query texts
+        limit: Maximum number of results per query
+        
+    Returns:
+        One list of MemorySearchResult objects per query, in query order
+    """
+    vector_store._flush_pending()
+    collection = vector_store._get_collection()
+    stored = collection.get(include=["embeddings"])
+    if not stored['ids']:
+        return [[] for _ in queries]
+    
+    # (queries x dim) @ (dim x memories): cosine similarities of all pairs
+    scores = vector_store._embed_texts(queries) @ np.asarray(stored['embeddings'], dtype=np.float32).T
+    rankings = [vector_store._top_k(row, limit) for row in scores]
+    
+    # Fetch documents and metadata only for the selected memories
+    selected = sorted({stored['ids'][i] for order, _ in rankings for i in order.tolist()})
+    documents = collection.get(ids=selected, include=["metadatas", "documents"])
+    by_id = dict(zip(documents['ids'], zip(documents['metadatas'], documents['documents'])))
+    
+    all_results = []
+    for order, row_scores in rankings:
+        results = []
+        for i, score in zip(order.tolist(), row_scores.tolist()):
+            metadata, document = by_id[stored['ids'][i]]
+            results.append(MemorySearchResult(
+                memory=vector_store._create_memory_from_metadata(metadata, document),
+                relevance_score=score,
+                match_type="semantic",
+                matched_fields=["content", "title"],
+                snippet=vector_store._create_snippet(document)
+            ))
+        all_results.append(results)
+    return all_results
+
+
 def test_vector_store_initialization():
     """Test vector store setup and initialization."""
     print("=" * 60)
@@ -38,7 +93,7 @@ def test_vector_store_initialization():
     
     try:
         # Test vector store config
-        config = VectorStoreConfig(str(test_dir))
+        config = small_vector_store_config(str(test_dir))
         print(f"✅ Vector store config created")
         print(f"   Data dir: {config.data_dir}")
         print(f"   Collection: {config.collection_name}")
@@ -100,15 +155,13 @@ def test_memory_embedding_storage(vector_store: VectorStore):
             )
         ]
         
-        # Add memories to vector store
-        successful_adds = 0
-        for memory in test_memories:
-            success = vector_store.add_memory(memory)
-            if success:
-                successful_adds += 1
-                print(f"✅ Added memory {memory.id}: '{memory.title}'")
-            else:
-                print(f"❌ Failed to add memory {memory.id}")
+        # Add all memories to vector store in one batch
+        success = vector_store.add_memories(test_memories)
+        successful_adds = len(test_memories) if success else 0
+        if success:
+            print(f"✅ Added {len(test_memories)} memories in one batch")
+        else:
+            print(f"❌ Failed to add memories {[memory.id for memory in test_memories]}")
         
         print(f"\\n📊 Results: {successful_adds}/{len(test_memories)} memories added successfully")
         
@@ -125,8 +178,12 @@ def test_memory_embedding_storage(vector_store: VectorStore):
         return False, []
 
 
-def test_semantic_search(vector_store: VectorStore, test_memories: List[Memory]):
-    """Test semantic similarity search."""
+def test_semantic_search(vector_store: VectorStore, test_memories: List[Memory], fast_path: bool = False):
+    """Test semantic similarity search.
+    
+    With fast_path, all queries are scored in one exact matrix search
+    instead of separate index searches.
+    """
     print("\\n" + "=" * 60)
     print("SEMANTIC SEARCH TEST")
     print("=" * 60)
@@ -163,17 +220,28 @@ def test_semantic_search(vector_store: VectorStore, test_memories: List[Memory])
     successful_searches = 0
     
     try:
-        for i, test_case in enumerate(test_queries, 1):
+        if fast_path:
+            all_results = search_matrix(vector_store, [tc["query"] for tc in test_queries], limit=3)
+        else:
+            # Run the independent searches concurrently; embedding and HNSW
+            # queries release the GIL
+            with ThreadPoolExecutor(max_workers=len(test_queries)) as executor:
+                all_results = list(executor.map(
+                    lambda test_case: vector_store.search_memories(test_case["query"], limit=3),
+                    test_queries
+                ))
+        
+        for i, (test_case, results) in enumerate(zip(test_queries, all_results), 1):
             query = test_case["query"]
             expected_keywords = test_case["expected_keywords"]
             description = test_case["description"]
+            keyword_pattern = re.compile("|".join(
+                re.escape(kw.lower()) for kw in sorted(expected_keywords, key=len, reverse=True)
+            ))
             
             print(f"\\n{i}️⃣ Testing query: '{query}'")
             print(f"   Expected: {description}")
             
-            # Perform search
-            results = vector_store.search_memories(query, limit=3)
-            
             if results:
                 print(f"   ✅ Found {len(results)} results:")
                 for j, result in enumerate(results[:3]):
@@ -183,13 +251,14 @@ def test_semantic_search(vector_store: VectorStore, test_memories: List[Memory])
                     print(f"      {j+1}. {title} (similarity: {similarity:.3f})")
                     print(f"         {preview}")
                 
-                # Check if results contain expected keywords
+                # Check if results contain expected keywords, in one pass over the text
                 all_text = " ".join([
                     result.title + " " + result.snippet
                     for result in results
                 ]).lower()
                 
-                found_keywords = [kw for kw in expected_keywords if kw.lower() in all_text]
+                found = set(keyword_pattern.findall(all_text))
+                found_keywords = [kw for kw in expected_keywords if kw.lower() in found]
                 if found_keywords:
                     print(f"   ✅ Found expected keywords: {found_keywords}")
                     successful_searches += 1
@@ -293,6 +362,181 @@ def test_memory_operations(vector_store: VectorStore):
         return False
 
 
+def test_queued_memory_additions(tmp_path):
+    """Test that queue_memory holds memories until the next write or read."""
+    config = VectorStoreConfig(str(tmp_path))
+    config.pending_flush_size = 3
+    vector_store = VectorStore(config)
+    
+    # Precomputed unit-norm embeddings, so no embedding model is needed
+    embedding = [1.0 / 384 ** 0.5] * 384
+    memories = [Memory(id=i, content=f"Queued memory {i}", title=f"Queued {i}") for i in range(1, 6)]
+    
+    assert vector_store.queue_memory(memories[0], embedding)
+    assert vector_store.queue_memory(memories[1], embedding)
+    assert len(vector_store._pending) == 2
+    
+    # Reaching pending_flush_size writes the queue in one batch
+    assert vector_store.queue_memory(memories[2], embedding)
+    assert not vector_store._pending
+    
+    # Reads flush the queue first
+    assert vector_store.queue_memory(memories[3], embedding)
+    assert vector_store.get_collection_stats()["total_documents"] == 4
+    
+    # add_memory writes immediately, along with anything queued
+    assert vector_store.add_memory(memories[4], embedding)
+    assert not vector_store._pending
+    assert vector_store.get_collection_stats()["total_documents"] == 5
+    
+    # The count is reused until the collection changes
+    count_cache = vector_store._count_cache
+    assert vector_store.get_collection_stats()["total_documents"] == 5
+    assert vector_store._count_cache is count_cache
+    assert vector_store.delete_memory(5)
+    assert vector_store.get_collection_stats()["total_documents"] == 4
+
+
+def test_failed_writes_are_requeued(tmp_path):
+    """Test that failed chunks are retried and do not block later chunks."""
+    config = VectorStoreConfig(str(tmp_path))
+    config.add_batch_size = 2
+    config.max_add_attempts = 2
+    vector_store = VectorStore(config)
+    collection = vector_store._get_collection()
+    
+    class FlakyCollection:
+        """Collection whose add calls fail for the given IDs."""
+        
+        def __init__(self):
+            self.failing_ids = set()
+        
+        def __getattr__(self, name):
+            return getattr(collection, name)
+        
+        def add(self, **kwargs):
+            if self.failing_ids & set(kwargs["ids"]):
+                raise RuntimeError("disk full")
+            return collection.add(**kwargs)
+    
+    flaky_collection = FlakyCollection()
+    vector_store._get_collection = lambda: flaky_collection
+    embedding = [1.0 / 384 ** 0.5] * 384
+    memories = [Memory(id=i, content="x" * (10 - i), title=f"Memory {i}") for i in range(1, 6)]
+    
+    # The first chunk fails and is queued again; the later chunks are still written
+    flaky_collection.failing_ids = {"memory_1"}
+    assert not vector_store.add_memories(memories, [embedding] * 5)
+    assert [memory.id for memory, _ in vector_store._pending] == [1, 2]
+    assert collection.count() == 3
+    
+    # The next flush retries it; memory 2 goes through once split from memory 1
+    config.add_batch_size = 1
+    assert vector_store.get_collection_stats()["total_documents"] == 4
+    assert [memory.id for memory, _ in vector_store._pending] == []
+    
+    # A memory that keeps failing is dropped after max_add_attempts
+    assert collection.get(ids=["memory_1"])["ids"] == []
+    assert not vector_store._add_failures
+    
+    # A transient failure is retried and succeeds
+    flaky_collection.failing_ids = {"memory_6"}
+    assert not vector_store.add_memory(Memory(id=6, content="y", title="Memory 6"), embedding)
+    flaky_collection.failing_ids = set()
+    assert vector_store.get_collection_stats()["total_documents"] == 5
+    assert not vector_store._pending
+    assert not vector_store._add_failures
+
+
+def test_query_embedding_cache(tmp_path):
+    """Test that query embeddings are memoized and persisted across instances."""
+    calls = []
+    
+    def embedding_function(texts):
+        calls.extend(texts)
+        return [[3.0, 4.0] for _ in texts]
+    
+    config = VectorStoreConfig(str(tmp_path))
+    config.persist_embeddings = True
+    config.embedding_cache_path = tmp_path / "embeddings.db"
+    vector_store = VectorStore(config)
+    vector_store._embedding_function = embedding_function
+    
+    # Query embeddings are normalized for the inner product space
+    embedding = vector_store._embed_query("project deadlines")
+    assert embedding == pytest.approx((0.6, 0.8))
+    assert vector_store._embed_query("project deadlines") == embedding
+    assert calls == ["project deadlines"]
+    
+    # A new instance reads the embedding from disk
+    restarted = VectorStore(config)
+    restarted._embedding_function = embedding_function
+    assert restarted._embed_query("project deadlines") == pytest.approx(embedding)
+    assert calls == ["project deadlines"]
+    
+    # Batches only embed the texts missing from the disk cache
+    matrix = restarted._embed_texts(["project deadlines", "team offsite"])
+    assert matrix.shape == (2, 2)
+    assert calls == ["project deadlines", "team offsite"]
+
+
+def test_search_reranks_candidates(tmp_path):
+    """Test that search results are re-ranked by exact cosine similarity."""
+    vector_store = VectorStore(VectorStoreConfig(str(tmp_path)))
+    
+    def unit(*components):
+        vector = components + (0.0,) * (384 - len(components))
+        norm = sum(c * c for c in vector) ** 0.5
+        return [c / norm for c in vector]
+    
+    memories = [Memory(id=i, content=f"Memory number {i}", title=f"Memory {i}") for i in range(1, 4)]
+    assert vector_store.add_memories(memories, [unit(1.0, 0.0), unit(0.6, 0.8), unit(0.0, 1.0)])
+    
+    # Search with a fixed query embedding instead of running a model
+    query = tuple(unit(0.0, 1.0))
+    vector_store._embed_query = lambda text: query
+    results = vector_store.search_memories("second axis", limit=2)
+    
+    assert [result.memory.id for result in results] == [3, 2]
+    assert [result.relevance_score for result in results] == pytest.approx([1.0, 0.8], abs=1e-5)
+    
+    # min_score drops weaker matches before results are built
+    results = vector_store.search_memories("second axis", limit=3, min_score=0.9)
+    assert [result.memory.id for result in results] == [3]
+    
+    # Matrix search scores several queries against every memory at once
+    vector_store._embed_texts = lambda texts: np.array([unit(1.0, 0.0), query], dtype=np.float32)
+    first_axis, second_axis = search_matrix(vector_store, ["first axis", "second axis"], limit=2)
+    assert [result.memory.id for result in first_axis] == [1, 2]
+    assert [result.memory.id for result in second_axis] == [3, 2]
+    assert second_axis[1].relevance_score == pytest.approx(0.8, abs=1e-5)
+
+
+def test_search_cache_expires(tmp_path):
+    """Test that cached search results expire so outside writes show up."""
+    config = VectorStoreConfig(str(tmp_path))
+    config.query_cache_ttl = 0.05
+    vector_store = VectorStore(config)
+    embedding = [1.0 / 384 ** 0.5] * 384
+    vector_store._embed_query = lambda text: tuple(embedding)
+    assert vector_store.add_memory(Memory(id=1, content="First memory", title="Memory 1"), embedding)
+    assert len(vector_store.search_memories("memory")) == 1
+    
+    # Written behind the store's back, as another process would
+    vector_store._get_collection().add(
+        documents=["Second memory"],
+        metadatas=[vector_store._create_metadata_for_chromadb(
+            Memory(id=2, content="Second memory", title="Memory 2")
+        )],
+        ids=["memory_2"],
+        embeddings=[embedding]
+    )
+    assert len(vector_store.search_memories("memory")) == 1
+    
+    time.sleep(0.1)
+    assert len(vector_store.search_memories("memory")) == 2
+
+
 def test_integration_with_memory_service():
     """Test vector store integration with memory service."""
     print("\\n" + "=" * 60)
@@ -384,7 +628,10 @@ def main():
         
         if storage_success:
             # Test 3: Semantic search
-            search_success = test_semantic_search(vector_store, test_memories)
+            search_success = test_semantic_search(
+                vector_store, test_memories,
+                fast_path=os.environ.get("INFO_AGENT_FAST_TESTS") == "1"
+            )
             test_results.append(("Semantic Search", search_success))
             
             # Test 4: Memory operations
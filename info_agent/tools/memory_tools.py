@@ -5,29 +5,96 @@ Simple, direct tool implementations that wrap the existing repository layer
 for use with LangGraph agents. No unnecessary abstraction layers.
 """
 
-import json
 import logging
-from typing import List, Optional, Dict, Any
+from typing import Callable, Hashable, List, Optional, Dict, Any, Tuple
+
+import orjson
 from langchain_core.tools import tool
+from ..core.models import MemorySearchResult
 from ..core.repository import get_memory_service
+from ..utils.semantic_cache import SemanticCache
 
 logger = logging.getLogger(__name__)
 
+# Recent search tool responses, reused for near-duplicate queries
+_response_cache = SemanticCache(threshold=0.97, max_size=256, ttl=300.0)
+
+
+def _dumps(payload: Any) -> str:
+    """Serialize a tool response as compact JSON (datetimes as ISO 8601)."""
+    return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
 
-def format_memory_result(result) -> Dict[str, Any]:
+
+def format_memory_result(result: MemorySearchResult) -> Dict[str, Any]:
     """Format a MemorySearchResult for tool output with ranking transparency"""
+    # MemorySearchResult and Memory are dataclasses, so every field is set
+    memory = result.memory
+    created_at = memory.created_at
     return {
-        "memory_id": result.memory.id,
-        "title": result.memory.title,
-        "content": result.memory.content,
-        "relevance_score": getattr(result, 'relevance_score', 1.0),
-        "match_type": getattr(result, 'match_type', 'unknown'),
-        "ranking_explanation": getattr(result, 'ranking_explanation', ''),
-        "created_date": result.memory.created_at.isoformat() if hasattr(result.memory, 'created_at') and result.memory.created_at else None,
-        "dynamic_fields": result.memory.dynamic_fields or {}
+        "memory_id": memory.id,
+        "title": memory.title,
+        "content": memory.content,
+        "relevance_score": result.relevance_score,
+        "match_type": result.match_type,
+        "ranking_explanation": result.ranking_explanation,
+        "created_date": created_at.isoformat() if created_at else None,
+        "dynamic_fields": memory.dynamic_fields or {}
     }
 
 
+def _search_with_cache(method: str, query: str, params: Hashable,
+                       search: Callable[[], Dict[str, Any]],
+                       match_similar: bool = True) -> str:
+    """
+    Run a search tool, reusing the response of an earlier query.
+    
+    Responses are cached per method and parameters, and are dropped once
+    this process changes the vector store or after five minutes. Writes by
+    other processes show up once both this cache and the vector store's
+    own result cache (query_cache_ttl) have expired. With match_similar,
+    a near-duplicate query (by embedding similarity) reuses the response
+    and the hit is marked with "cache": "semantic_hit"; otherwise only the
+    exact query text matches.
+    
+    Args:
+        method: Search method name
+        query: Search query text
+        params: Other search parameters that must match exactly
+        search: Runs the search and returns the response payload
+        match_similar: Reuse responses of near-duplicate queries. Only safe
+            for purely semantic searches; keyword matching depends on the
+            exact terms, e.g. "meeting with John" vs "meeting with Joan".
+        
+    Returns:
+        JSON string with the search response
+    """
+    vector_store = getattr(get_memory_service().repository, 'vector_store', None)
+    embedding = None
+    if vector_store is not None:
+        try:
+            embedding = vector_store.embed_query(query)
+        except Exception as e:
+            logger.debug(f"Query embedding unavailable, skipping response cache: {e}")
+    
+    if embedding is not None:
+        namespace = (method, params, vector_store.generation)
+        if match_similar:
+            cached = _response_cache.get_similar(embedding, namespace)
+            if cached is not None:
+                logger.info(f"{method.capitalize()} search for '{query}' served from response cache")
+                return _dumps({**cached, "query": query, "cache": "semantic_hit"})
+        else:
+            cached = _response_cache.get((namespace, query))
+            if cached is not None:
+                logger.info(f"{method.capitalize()} search for '{query}' served from response cache")
+                return _dumps(cached)
+    
+    payload = search()
+    if embedding is not None:
+        _response_cache.put((namespace, query), embedding, payload, namespace)
+    return _dumps(payload)
+
+
 @tool
 def search_memories_structured(query: str, limit: int = 10) -> str:
     """
@@ -52,16 +119,16 @@ def search_memories_structured(query: str, limit: int = 10) -> str:
         formatted_results = [format_memory_result(result) for result in results]
         
         logger.info(f"Found {len(formatted_results)} structured search results")
-        return json.dumps({
+        return _dumps({
             "method": "structured",
             "query": query,
             "count": len(formatted_results),
             "results": formatted_results
-        }, indent=2)
+        })
         
     except Exception as e:
         logger.error(f"Structured search failed: {e}")
-        return json.dumps({
+        return _dumps({
             "method": "structured",
             "query": query,
             "error": str(e),
@@ -89,28 +156,28 @@ def search_memories_semantic(query: str, limit: int = 5, similarity_threshold: f
     try:
         logger.info(f"Semantic search: '{query}' (limit: {limit}, threshold: {similarity_threshold})")
         
-        memory_service = get_memory_service()
-        results = memory_service.semantic_search_memories(query, limit=min(limit, 20))
-        
-        # Filter by similarity threshold
-        filtered_results = []
-        for result in results:
-            score = getattr(result, 'relevance_score', 1.0)
-            if score >= similarity_threshold:
-                filtered_results.append(format_memory_result(result))
+        def search() -> Dict[str, Any]:
+            memory_service = get_memory_service()
+            # The vector store filters by similarity threshold on its score array
+            results = memory_service.semantic_search_memories(
+                query, limit=min(limit, 20), min_score=similarity_threshold
+            )
+            filtered_results = [format_memory_result(result) for result in results]
+            
+            logger.info(f"Found {len(filtered_results)} semantic search results")
+            return {
+                "method": "semantic",
+                "query": query,
+                "similarity_threshold": similarity_threshold,
+                "count": len(filtered_results),
+                "results": filtered_results
+            }
         
-        logger.info(f"Found {len(filtered_results)} semantic search results (filtered from {len(results)})")
-        return json.dumps({
-            "method": "semantic",
-            "query": query,
-            "similarity_threshold": similarity_threshold,
-            "count": len(filtered_results),
-            "results": filtered_results
-        }, indent=2)
+        return _search_with_cache("semantic", query, (limit, similarity_threshold), search)
         
     except Exception as e:
         logger.error(f"Semantic search failed: {e}")
-        return json.dumps({
+        return _dumps({
             "method": "semantic",
             "query": query,
             "error": str(e),
@@ -137,22 +204,26 @@ def search_memories_hybrid(query: str, limit: int = 10) -> str:
     try:
         logger.info(f"Hybrid search: '{query}' (limit: {limit})")
         
-        memory_service = get_memory_service()
-        results = memory_service.hybrid_search_memories(query, limit=min(limit, 50))
+        def search() -> Dict[str, Any]:
+            memory_service = get_memory_service()
+            results = memory_service.hybrid_search_memories(query, limit=min(limit, 50))
+            
+            formatted_results = [format_memory_result(result) for result in results]
+            
+            logger.info(f"Found {len(formatted_results)} hybrid search results")
+            return {
+                "method": "hybrid",
+                "query": query,
+                "count": len(formatted_results),
+                "results": formatted_results
+            }
         
-        formatted_results = [format_memory_result(result) for result in results]
-        
-        logger.info(f"Found {len(formatted_results)} hybrid search results")
-        return json.dumps({
-            "method": "hybrid",
-            "query": query,
-            "count": len(formatted_results),
-            "results": formatted_results
-        }, indent=2)
+        # Hybrid results include keyword matches, so only exact repeats are reused
+        return _search_with_cache("hybrid", query, (limit,), search, match_similar=False)
         
     except Exception as e:
         logger.error(f"Hybrid search failed: {e}")
-        return json.dumps({
+        return _dumps({
             "method": "hybrid", 
             "query": query,
             "error": str(e),
@@ -189,62 +260,81 @@ def get_memory_by_id(memory_id: int) -> str:
                 "word_count": len(memory.content.split()) if memory.content else 0
             }
             logger.info(f"Retrieved memory {memory_id}: '{memory.title}'")
-            return json.dumps(result, indent=2)
+            return _dumps(result)
         else:
             logger.warning(f"Memory {memory_id} not found")
-            return json.dumps({
+            return _dumps({
                 "error": f"Memory with ID {memory_id} not found",
                 "memory_id": memory_id
             })
             
     except Exception as e:
         logger.error(f"Failed to get memory {memory_id}: {e}")
-        return json.dumps({
+        return _dumps({
             "error": str(e),
             "memory_id": memory_id
         })
 
 
+def _decode_cursor(cursor: str) -> Tuple[str, int]:
+    """Split a pagination cursor into its (created_at, id) position."""
+    created_at, _, memory_id = cursor.rpartition("|")
+    return created_at, int(memory_id)
+
+
 @tool
-def get_recent_memories(limit: int = 20, offset: int = 0) -> str:
+def get_recent_memories(limit: int = 20, offset: int = 0, cursor: Optional[str] = None) -> str:
     """
     Get recent memories in chronological order.
     
     Args:
         limit: Maximum number of memories to return (1-50)
         offset: Number of memories to skip (for pagination)
+        cursor: next_cursor from a previous call, to get the following page
+            (preferred over offset)
         
     Returns:
         JSON string with list of recent memories
     """
     try:
-        logger.info(f"Getting recent memories (limit: {limit}, offset: {offset})")
+        logger.info(f"Getting recent memories (limit: {limit}, offset: {offset}, cursor: {cursor})")
         
         memory_service = get_memory_service()
-        memories = memory_service.list_recent_memories(limit=min(limit, 50), offset=offset)
+        limit = min(limit, 50)
+        before = _decode_cursor(cursor) if cursor else None
+        # Content is truncated to 200 characters by the database
+        memories = memory_service.list_recent_memory_previews(
+            limit=limit, offset=offset, before=before, preview_length=200
+        )
         
         results = []
         for memory in memories:
             results.append({
                 "memory_id": memory.id,
                 "title": memory.title,
-                "content": memory.content[:200] + "..." if len(memory.content) > 200 else memory.content,
-                "created_date": memory.created_at.isoformat() if hasattr(memory, 'created_at') and memory.created_at else None,
+                "content": memory.content_preview,
+                "created_date": memory.created_at.isoformat() if memory.created_at else None,
                 "dynamic_fields": memory.dynamic_fields or {},
-                "word_count": len(memory.content.split()) if memory.content else 0
+                "word_count": memory.word_count
             })
         
+        # A full page may be followed by more memories
+        next_cursor = None
+        if len(memories) == limit and memories[-1].created_at:
+            next_cursor = f"{memories[-1].created_at.isoformat()}|{memories[-1].id}"
+        
         logger.info(f"Retrieved {len(results)} recent memories")
-        return json.dumps({
+        return _dumps({
             "count": len(results),
             "limit": limit,
             "offset": offset,
+            "next_cursor": next_cursor,
             "memories": results
-        }, indent=2)
+        })
         
     except Exception as e:
         logger.error(f"Failed to get recent memories: {e}")
-        return json.dumps({
+        return _dumps({
             "error": str(e),
             "count": 0,
             "memories": []
@@ -266,11 +356,11 @@ def get_memory_statistics() -> str:
         stats = memory_service.get_service_statistics()
         
         logger.info(f"Retrieved memory statistics: {stats.get('total_memories', 0)} total memories")
-        return json.dumps(stats, indent=2, default=str)
+        return _dumps(stats)
         
     except Exception as e:
         logger.error(f"Failed to get memory statistics: {e}")
-        return json.dumps({
+        return _dumps({
             "error": str(e),
             "total_memories": 0
         })
@@ -5,9 +5,12 @@ Test script for direct LangChain tools
 Simple test to verify our simplified tools work correctly.
 """
 
+import logging
 import sys
 import os
-import json
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
@@ -22,6 +25,8 @@ from info_agent.tools.memory_tools import (
     get_all_memory_tools
 )
 
+logger = logging.getLogger(__name__)
+
 
 def test_direct_tools():
     """Test direct LangChain tools functionality"""
@@ -36,10 +41,22 @@ def test_direct_tools():
         for tool in tools:
             print(f"      - {tool.name}: {tool.description[:60]}...")
         
+        # The probes are independent and I/O-bound, so run them concurrently
+        # and report the results in order
+        jobs = [
+            ("stats", get_memory_statistics, {}),
+            ("recent", get_recent_memories, {"limit": 5}),
+            ("structured", search_memories_structured, {"query": "test", "limit": 3}),
+            ("semantic", search_memories_semantic, {"query": "test", "limit": 3}),
+            ("hybrid", search_memories_hybrid, {"query": "test", "limit": 3}),
+        ]
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {name: executor.submit(tool.invoke, args) for name, tool, args in jobs}
+        results = {name: orjson.loads(future.result()) for name, future in futures.items()}
+        
         # Test memory statistics
         print("\n2. Testing memory statistics...")
-        stats_result = get_memory_statistics.invoke({})
-        stats = json.loads(stats_result)
+        stats = results["stats"]
         if "error" not in stats:
             print(f"   ✅ Statistics successful: {stats.get('total_memories', 0)} total memories")
         else:
@@ -47,8 +64,7 @@ def test_direct_tools():
         
         # Test recent memories
         print("\n3. Testing recent memories...")
-        recent_result = get_recent_memories.invoke({"limit": 5})
-        recent = json.loads(recent_result)
+        recent = results["recent"]
         if "error" not in recent:
             print(f"   ✅ Recent memories successful: {recent['count']} memories")
             if recent['memories']:
@@ -58,8 +74,7 @@ def test_direct_tools():
         
         # Test structured search
         print("\n4. Testing structured search...")
-        search_result = search_memories_structured.invoke({"query": "test", "limit": 3})
-        search = json.loads(search_result)
+        search = results["structured"]
         if "error" not in search:
             print(f"   ✅ Structured search successful: {search['count']} results")
             if search['results']:
@@ -69,8 +84,7 @@ def test_direct_tools():
         
         # Test semantic search
         print("\n5. Testing semantic search...")
-        semantic_result = search_memories_semantic.invoke({"query": "test", "limit": 3})
-        semantic = json.loads(semantic_result)
+        semantic = results["semantic"]
         if "error" not in semantic:
             print(f"   ✅ Semantic search successful: {semantic['count']} results")
             if semantic['results']:
@@ -80,8 +94,7 @@ def test_direct_tools():
         
         # Test hybrid search
         print("\n6. Testing hybrid search...")
-        hybrid_result = search_memories_hybrid.invoke({"query": "test", "limit": 3})
-        hybrid = json.loads(hybrid_result)
+        hybrid = results["hybrid"]
         if "error" not in hybrid:
             print(f"   ✅ Hybrid search successful: {hybrid['count']} results")
             if hybrid['results']:
@@ -95,7 +108,7 @@ def test_direct_tools():
             print("\n7. Testing get memory by ID...")
             memory_id = recent['memories'][0]['memory_id']
             id_result = get_memory_by_id.invoke({"memory_id": memory_id})
-            id_data = json.loads(id_result)
+            id_data = orjson.loads(id_result)
             if "error" not in id_data:
                 print(f"   ✅ Get by ID successful: {id_data['title']}")
             else:
@@ -104,10 +117,8 @@ def test_direct_tools():
         print("\n✅ Direct tools test completed successfully!")
         return True
         
-    except Exception as e:
-        print(f"\n❌ Direct tools test failed: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("❌ Direct tools test failed")
         return False
 
 
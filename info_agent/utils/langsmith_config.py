@@ -5,12 +5,20 @@ Provides utilities for configuring LangSmith tracing and monitoring
 for the Memory Agent system.
 """
 
+import atexit
+import importlib.util
 import os
 import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Dict, Any
-from functools import wraps
+from functools import lru_cache, wraps
 import uuid
 
+# Probed once without importing; langsmith itself is loaded on first use
+_LANGSMITH_SPEC = importlib.util.find_spec("langsmith")
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,18 +50,141 @@ class LangSmithConfig:
         }
 
 
-def setup_langsmith_tracing(project_name: Optional[str] = None) -> bool:
+# Configuration and client shared by all callers, created on first use
+_config: Optional[LangSmithConfig] = None
+_client = None
+_state_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _load_langsmith():
+    """Import langsmith once (only call when _LANGSMITH_SPEC is set)."""
+    import langsmith
+    return langsmith
+
+
+def _get_config(refresh: bool = False) -> LangSmithConfig:
+    """Get the shared LangSmith configuration.
+    
+    The environment is read on first use and cached; later changes to it
+    only take effect on a refresh. A refresh that changes the API key or
+    endpoint also closes the shared client, so the next use connects anew.
+    
+    Args:
+        refresh: Read the environment again
+    """
+    global _config, _client, _probe_future
+    stale_client = None
+    if _config is None or refresh:
+        with _state_lock:
+            if _config is None or refresh:
+                config = LangSmithConfig()
+                if _config is not None and (config.api_key, config.endpoint) != (_config.api_key, _config.endpoint):
+                    stale_client, _client = _client, None
+                    _probe_future = None
+                _config = config
+    if stale_client is not None:
+        _close_client(stale_client)
+    return _config
+
+
+def _get_client():
+    """Get the shared LangSmith client.
+    
+    Raises:
+        ImportError: If langsmith is not installed
+    """
+    global _client
+    if _client is None:
+        config = _get_config()
+        with _state_lock:
+            if _client is None:
+                if _LANGSMITH_SPEC is None:
+                    raise ImportError("langsmith is not installed")
+                _client = _load_langsmith().Client(api_key=config.api_key, api_url=config.endpoint)
+    return _client
+
+
+# Connection tests run in the background; a result is reused for this long
+_PROBE_TTL = 60.0
+_probe_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="langsmith-probe")
+_probe_future: Optional[Future] = None
+_probe_expires = 0.0
+
+
+def _probe_connection() -> Future:
+    """Start a background LangSmith connection test, or reuse a recent one.
+    
+    Returns:
+        Future resolving to the number of projects listed
+    """
+    global _probe_future, _probe_expires
+    with _state_lock:
+        expired = _probe_future is not None and _probe_future.done() and time.monotonic() >= _probe_expires
+        if _probe_future is None or expired:
+            _probe_future = _probe_executor.submit(lambda: len(list(_get_client().list_projects(limit=1))))
+            _probe_expires = time.monotonic() + _PROBE_TTL
+        return _probe_future
+
+
+def _log_probe_result(future: Future) -> None:
+    """Report a failed background connection test."""
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Failed to connect to LangSmith: {error}")
+
+
+def _close_langsmith() -> None:
+    """Stop connection tests, flush pending traces and close the shared client.
+    
+    Runs at interpreter exit only: the probe worker cannot be restarted.
+    """
+    global _client
+    _probe_executor.shutdown(wait=False, cancel_futures=True)
+    with _state_lock:
+        client, _client = _client, None
+    if client is not None:
+        _close_client(client)
+
+
+def _close_client(client) -> None:
+    """Flush pending traces and close a LangSmith client."""
+    try:
+        if hasattr(client, "close"):
+            # Drains the background tracing buffer, then closes the session;
+            # bounded so an unreachable endpoint cannot hang exit or a reconfigure
+            client.close(timeout=5.0)
+        else:
+            client.flush()
+            client.session.close()
+    except Exception as e:
+        logger.debug(f"Error closing LangSmith client: {e}")
+
+
+atexit.register(_close_langsmith)
+
+
+def setup_langsmith_tracing(project_name: Optional[str] = None,
+                            require_connection: bool = False) -> bool:
     """
     Setup LangSmith tracing for the application
     
+    The connection test runs in the background unless require_connection is
+    set, so startup does not wait on the LangSmith API.
+    
+    The LANGCHAIN_* environment variables are read once per process and
+    cached. This function reads them again, so call it after changing them;
+    traced operations follow the new settings from their next call.
+    
     Args:
         project_name: Optional project name override
+        require_connection: Wait for the connection test and fail if it fails
         
     Returns:
         bool: True if successfully configured, False otherwise
     """
     try:
-        config = LangSmithConfig()
+        config = _get_config(refresh=True)
         
         if not config.is_configured():
             if not config.tracing_enabled:
@@ -67,13 +198,15 @@ def setup_langsmith_tracing(project_name: Optional[str] = None) -> bool:
             os.environ["LANGCHAIN_PROJECT"] = project_name
             config.project_name = project_name
         
-        # Import langsmith after environment is set
         try:
-            from langsmith import Client
-            client = Client(api_key=config.api_key, api_url=config.endpoint)
+            _get_client()
             
             # Test connection
-            client.list_projects(limit=1)
+            probe = _probe_connection()
+            if require_connection:
+                probe.result()
+            else:
+                probe.add_done_callback(_log_probe_result)
             
             logger.info(f"✅ LangSmith tracing enabled for project: {config.project_name}")
             return True
@@ -99,32 +232,29 @@ def trace_agent_operation(operation_name: str, metadata: Optional[Dict[str, Any]
         metadata: Additional metadata to include in the trace
     """
     def decorator(func):
+        # Built on the first traced call and reused; whether to trace is
+        # decided per call from the shared config, so tracing set up by
+        # setup_langsmith_tracing after decoration still takes effect
+        traced_func = None
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            config = LangSmithConfig()
-            
-            if not config.is_configured():
-                # If LangSmith not configured, just run the function
+            nonlocal traced_func
+            if _LANGSMITH_SPEC is None or not _get_config().is_configured():
+                # If LangSmith not available or configured, just run the function
                 return func(*args, **kwargs)
             
-            try:
-                from langsmith import traceable
-                
-                # Create a traceable version of the function
-                traced_func = traceable(
-                    name=operation_name,
-                    metadata=metadata or {},
-                    tags=["memory-agent", "info-agent"]
-                )(func)
-                
-                return traced_func(*args, **kwargs)
-                
-            except ImportError:
-                # If langsmith not available, just run the function
-                return func(*args, **kwargs)
-            except Exception as e:
-                logger.warning(f"Error in LangSmith tracing for {operation_name}: {e}")
-                return func(*args, **kwargs)
+            if traced_func is None:
+                try:
+                    traced_func = _load_langsmith().traceable(
+                        name=operation_name,
+                        metadata=metadata or {},
+                        tags=["memory-agent", "info-agent"]
+                    )(func)
+                except Exception as e:
+                    logger.warning(f"Error in LangSmith tracing for {operation_name}: {e}")
+                    traced_func = func
+            return traced_func(*args, **kwargs)
         
         return wrapper
     return decorator
@@ -133,7 +263,8 @@ def trace_agent_operation(operation_name: str, metadata: Optional[Dict[str, Any]
 def create_run_context(
     query: str, 
     operation_type: str, 
-    user_id: Optional[str] = None
+    user_id: Optional[str] = None,
+    session_id: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Create context information for LangSmith runs
@@ -142,6 +273,7 @@ def create_run_context(
         query: User query being processed
         operation_type: Type of operation (search, statistics, etc.)
         user_id: Optional user identifier
+        session_id: Session to group the run under. If None, a new one is created.
         
     Returns:
         Dictionary with context information
@@ -150,7 +282,7 @@ def create_run_context(
         "query": query,
         "operation_type": operation_type,
         "user_id": user_id or "anonymous",
-        "session_id": str(uuid.uuid4()),
+        "session_id": session_id or uuid.uuid4().hex,
         "agent_version": "1.0.0",
         "component": "memory-agent"
     }
@@ -171,15 +303,11 @@ def log_tool_execution(
         result: Tool execution result
         error: Error message if execution failed
     """
-    config = LangSmithConfig()
-    
-    if not config.is_configured():
+    if not _get_config().is_configured():
         return
     
     try:
-        from langsmith import Client
-        
-        client = Client()
+        client = _get_client()
         
         # Create a custom event for tool execution
         event_data = {
@@ -187,8 +315,9 @@ def log_tool_execution(
             "args": tool_args,
             "success": error is None,
             "error": error,
-            "result_length": len(str(result)) if result else 0,
-            "timestamp": "now"
+            # Tool results are JSON strings; avoid str() on other payloads
+            "result_length": len(result) if hasattr(result, "__len__") else 0,
+            "timestamp": time.time_ns()
         }
         
         # This would be logged as part of the larger trace
@@ -202,10 +331,13 @@ def get_langsmith_status() -> Dict[str, Any]:
     """
     Get current LangSmith configuration status
     
+    The connection test result is shared with setup_langsmith_tracing and
+    reused for a minute; while it is still running the status is "pending".
+    
     Returns:
         Dictionary with status information
     """
-    config = LangSmithConfig()
+    config = _get_config()
     
     status = {
         "configured": config.is_configured(),
@@ -217,13 +349,12 @@ def get_langsmith_status() -> Dict[str, Any]:
     
     if config.is_configured():
         try:
-            from langsmith import Client
-            client = Client(api_key=config.api_key, api_url=config.endpoint)
-            
-            # Test connection
-            projects = list(client.list_projects(limit=1))
-            status["connection_test"] = "success"
-            status["available_projects"] = len(projects)
+            probe = _probe_connection()
+            if probe.done():
+                status["available_projects"] = probe.result()
+                status["connection_test"] = "success"
+            else:
+                status["connection_test"] = "pending"
             
         except ImportError:
             status["connection_test"] = "langsmith_not_installed"
@@ -1,10 +1,41 @@
 """Logging configuration for the Info Agent application."""
 
+import atexit
 import logging
 import logging.config
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+# Writes records for the info_agent logger handlers on a background thread
+_listener: Optional[QueueListener] = None
+
+
+class FastFormatter(logging.Formatter):
+    """Formatter that renders the timestamp once per second.
+    
+    With a datefmt, all records from the same second share the same
+    timestamp text, so strftime runs once per second instead of per record.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, rendered timestamp), swapped as a unit
+        self._cached_time = (None, "")
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        # Without a datefmt the timestamp includes milliseconds
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, text = self._cached_time
+        if second != cached_second:
+            text = super().formatTime(record, datefmt)
+            self._cached_time = (second, text)
+        return text
 
 
 def setup_logging(
@@ -15,6 +46,10 @@ def setup_logging(
     """
     Configure logging for the application.
     
+    The info_agent logger's console and file handlers run behind a
+    QueueListener, so logging calls only enqueue records and formatting and
+    file I/O happen on a background thread.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file name
@@ -26,8 +61,30 @@ def setup_logging(
     # Create log directory if it doesn't exist
     Path(log_dir).mkdir(parents=True, exist_ok=True)
     
+    global _listener
+    # Drain records queued for the previous handlers before they are replaced
+    if _listener is not None:
+        _listener.stop()
+    else:
+        atexit.register(_stop_listener)
+    
     config = get_logging_config(log_level, log_file, log_dir)
     logging.config.dictConfig(config)
+    
+    app_logger = logging.getLogger('info_agent')
+    handlers = app_logger.handlers[:]
+    for handler in handlers:
+        app_logger.removeHandler(handler)
+    log_queue = queue.SimpleQueue()
+    app_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def _stop_listener() -> None:
+    """Flush queued records at interpreter exit."""
+    if _listener is not None:
+        _listener.stop()
 
 
 def get_logging_config(
@@ -38,6 +95,9 @@ def get_logging_config(
     """
     Get logging configuration dictionary.
     
+    setup_logging moves the handlers configured here for the info_agent
+    logger behind a QueueHandler after applying this configuration.
+    
     Args:
         log_level: Logging level
         log_file: Optional log file name
@@ -59,10 +119,12 @@ def get_logging_config(
         'disable_existing_loggers': False,
         'formatters': {
             'standard': {
+                'class': 'info_agent.utils.logging_config.FastFormatter',
                 'format': '%(asctime)s [%(levelname)s] %(name)s: %(message)s',
                 'datefmt': '%Y-%m-%d %H:%M:%S'
             },
             'detailed': {
+                'class': 'info_agent.utils.logging_config.FastFormatter',
                 'format': '%(asctime)s [%(levelname)s] %(name)s:%(lineno)d: %(message)s',
                 'datefmt': '%Y-%m-%d %H:%M:%S'
             }
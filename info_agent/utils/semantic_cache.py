@@ -0,0 +1,188 @@
+"""
+Semantic cache for Info Agent.
+
+This module provides a bounded LRU cache whose entries can be found either
+by exact key or by embedding similarity, so near-duplicate queries can reuse
+previously computed results.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    LRU cache with exact-key and near-duplicate embedding lookups.
+
+    Unit-length embeddings are kept in one preallocated float32 matrix, so a
+    similarity lookup scores every entry with a single matrix-vector product
+    and masks out other namespaces. Entries can optionally expire after a
+    fixed time to live.
+    """
+
+    def __init__(self, threshold: float = 0.98, max_size: int = 1024,
+                 ttl: Optional[float] = None):
+        """
+        Initialize semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a near-duplicate hit
+            max_size: Maximum number of cached entries
+            ttl: Seconds an entry stays valid. If None, entries never expire.
+        """
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # key -> (matrix row, value, expiry time or None)
+        self._entries: "OrderedDict[Hashable, Tuple[int, Any, Optional[float]]]" = OrderedDict()
+        # Allocated on the first put, once the embedding dimension is known
+        self._matrix: Optional[np.ndarray] = None
+        self._reset_slots()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value by exact key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._expired(entry):
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def get_similar(self, embedding: Sequence[float],
+                    namespace: Hashable = None) -> Optional[Any]:
+        """
+        Get the cached value whose embedding is most similar to the given one.
+
+        Args:
+            embedding: Query embedding
+            namespace: Only entries stored under the same namespace match
+
+        Returns:
+            Cached value if the best match reaches the threshold, else None
+        """
+        vector = self._normalize(embedding)
+        with self._lock:
+            namespace_id = self._namespace_ids.get(namespace)
+            if namespace_id is None or self._matrix.shape[1] != vector.shape[0]:
+                return None
+
+            scores = self._matrix @ vector
+            scores[self._slot_namespaces != namespace_id] = -np.inf
+            while True:
+                slot = int(np.argmax(scores))
+                if scores[slot] < self.threshold:
+                    return None
+                key = self._slot_keys[slot]
+                entry = self._entries[key]
+                if not self._expired(entry):
+                    self._entries.move_to_end(key)
+                    return entry[1]
+                # Drop the expired entry and try the next best
+                self._remove(key)
+                scores[slot] = -np.inf
+
+    def put(self, key: Hashable, embedding: Sequence[float], value: Any,
+            namespace: Hashable = None) -> None:
+        """
+        Store a value under an exact key and its embedding.
+
+        Args:
+            key: Cache key
+            embedding: Embedding used for similarity lookups
+            value: Value to cache
+            namespace: Namespace the entry can be matched in
+        """
+        vector = self._normalize(embedding)
+        with self._lock:
+            if self._matrix is None or self._matrix.shape[1] != vector.shape[0]:
+                # Entries of another dimension can never match again
+                self._entries.clear()
+                self._reset_slots()
+                self._matrix = np.zeros((self.max_size, vector.shape[0]), dtype=np.float32)
+
+            if key in self._entries:
+                self._remove(key)
+            if not self._free_slots:
+                self._remove(next(iter(self._entries)))
+
+            namespace_id = self._namespace_ids.get(namespace)
+            if namespace_id is None:
+                namespace_id = self._next_namespace_id
+                self._next_namespace_id += 1
+                self._namespace_ids[namespace] = namespace_id
+                self._namespace_counts[namespace] = 0
+            self._namespace_counts[namespace] += 1
+
+            slot = self._free_slots.pop()
+            self._matrix[slot] = vector
+            self._slot_namespaces[slot] = namespace_id
+            self._slot_keys[slot] = key
+            self._slot_namespace_keys[slot] = namespace
+            expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+            self._entries[key] = (slot, value, expires_at)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._reset_slots()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _normalize(self, embedding: Sequence[float]) -> np.ndarray:
+        """Convert an embedding to a unit-length float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _reset_slots(self) -> None:
+        """Mark every matrix row free (caller holds the lock)."""
+        # Free rows have namespace id -1, which never matches a lookup
+        self._slot_namespaces = np.full(self.max_size, -1, dtype=np.int64)
+        self._slot_keys: List[Optional[Hashable]] = [None] * self.max_size
+        self._slot_namespace_keys: List[Hashable] = [None] * self.max_size
+        self._free_slots = list(range(self.max_size - 1, -1, -1))
+        # Namespaces map to ids for masking; counts let unused ones be dropped
+        self._namespace_ids: Dict[Hashable, int] = {}
+        self._namespace_counts: Dict[Hashable, int] = {}
+        self._next_namespace_id = 0
+
+    @staticmethod
+    def _expired(entry: Tuple[int, Any, Optional[float]]) -> bool:
+        """Check whether an entry has outlived the cache TTL."""
+        return entry[2] is not None and time.monotonic() >= entry[2]
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry and free its matrix row (caller holds the lock)."""
+        slot, _, _ = self._entries.pop(key)
+        namespace = self._slot_namespace_keys[slot]
+        self._slot_namespaces[slot] = -1
+        self._slot_keys[slot] = None
+        self._slot_namespace_keys[slot] = None
+        self._free_slots.append(slot)
+
+        self._namespace_counts[namespace] -= 1
+        if not self._namespace_counts[namespace]:
+            del self._namespace_counts[namespace]
+            del self._namespace_ids[namespace]
+
+
+# Export main classes
+__all__ = ['SemanticCache']